@@ -0,0 +1,92 @@
+"""Helper functions for preparing admin reports.
+
+The functions are grouped into submodules:
+    validation: Checking email addresses and numbers.
+    conversion: Converting values and columns of values.
+    tables: Report data held as lists, lists of lists or Tables.
+    dicts: Dictionaries of counts and ordered items.
+    interaction: Prompts for the user and debug output.
+    parallel: Running helpers on chunks of data in a process pool.
+    progress: Rate-limited progress reporting for long-running helpers.
+    profiling: Opt-in profiling of the admintools functions.
+    caching: Opt-in caching of the validation and conversion functions.
+
+Every function can still be used as admintools.<name>. A submodule, and any
+heavy dependencies such as NumPy, is only imported the first time one of its
+names is used. Module settings such as ARRAY_SELECT_SIZE must be changed on
+their submodule, e.g. admintools.dicts.ARRAY_SELECT_SIZE.
+"""
+
+import importlib
+import os
+
+
+_SUBMODULES = {
+    'caching': ['CACHE_POLICIES', 'CACHED_FUNCTIONS', 'clear_caches',
+                'disable_caching', 'enable_caching', 'get_cache_stats'],
+    'conversion': ['FLOAT_PATTERN', 'INT_PATTERN', 'convert_column_to_nan',
+                   'convert_column_to_value', 'convert_to_float',
+                   'convert_to_floats', 'convert_to_int', 'convert_to_ints',
+                   'convert_to_nan', 'convert_to_tuples', 'convert_to_value',
+                   'replace_string'],
+    'dicts': ['ARRAY_SELECT_SIZE', 'Ordering', 'copy_dict_reset',
+              'count_items', 'create_dict', 'create_ordered_dict',
+              'create_ordered_list', 'merge_counts', 'seed_dict',
+              'sort_dict_values', 'update_dict'],
+    'interaction': ['BATCH_ENV', 'BATCH_FILE_ENV', 'PROMPTS', 'check_action',
+                    'check_repeat', 'check_repeat_help', 'confirm_files',
+                    'debug_dict', 'debug_list', 'debug_list_item',
+                    'disable_batch_mode', 'enable_batch_mode',
+                    'load_batch_config'],
+    'parallel': ['parallel_apply', 'parallel_filter', 'parallel_map'],
+    'profiling': ['PROFILE_ENV', 'PROFILE_FILE_ENV', 'PROFILED_MODULES',
+                  'disable_profiling', 'enable_profiling', 'get_profile_stats',
+                  'reset_profile_stats', 'write_profile_stats'],
+    'progress': ['PROGRESS_CHUNKS', 'PROGRESS_INTERVAL', 'PROGRESS_LOG_STEP',
+                 'PROGRESS_STEP', 'Progress', 'set_progress'],
+    'tables': ['CSV_BUFFER_SIZE', 'CSV_CHUNK_SIZE', 'JOIN_METHODS',
+               'JOIN_TYPES', 'SORT_CHUNK_SIZE', 'TABLE_CHUNK_SIZE',
+               'ColumnIndex', 'Table', 'extract_list', 'extract_list_item',
+               'extract_lists', 'extract_lists_all', 'find_items',
+               'find_missing', 'find_missing_file', 'flatten_lists',
+               'get_common', 'get_common_file', 'iter_convert_to_tuples',
+               'iter_extract_list_item', 'iter_find_items',
+               'iter_remove_column', 'join_rows', 'list_difference',
+               'list_intersection', 'list_symmetric_difference', 'list_union',
+               'make_record_type', 'project_columns', 'read_csv_rows',
+               'remove_column', 'remove_duplicate_rows',
+               'remove_duplicates_file', 'remove_duplicates_list',
+               'remove_items', 'sort_id_file', 'to_records', 'write_csv_rows'],
+    'validation': ['EMAIL_PATTERN', 'EMAIL_PATTERN_2', 'check_email',
+                   'check_email_2', 'check_emails', 'check_emails_file',
+                   'check_is_float', 'check_is_int', 'check_lead_zero'],
+}
+_LOCATIONS = {name: module for module, names in _SUBMODULES.items() for name
+              in names}
+
+__all__ = sorted(_LOCATIONS)
+
+
+def __getattr__(name):
+    """Import the submodule that holds name and return name from it.
+
+    The result is cached on the package so later lookups are direct.
+    """
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name not in _LOCATIONS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+                             __name__, name))
+    module = importlib.import_module('.' + _LOCATIONS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
+
+
+# Turn on profiling at import, see profiling.PROFILE_ENV
+if os.environ.get('ADMINTOOLS_PROFILE'):
+    importlib.import_module('.profiling', __name__)
@@ -0,0 +1,38 @@
+"""Layers of function wrappers used by caching and profiling."""
+
+import sys
+
+
+# Attribute that holds the name of the layer a wrapper belongs to
+LAYER_ATTR = '_admintools_layer'
+
+
+def remove_layer(package_name, layer):
+    """Take one layer of wrappers out of the package and its submodules.
+
+    Each wrapper is marked with the name of its layer in LAYER_ATTR and calls
+    the function it wraps through its __wrapped__ attribute, so layers can be
+    stacked in any order. A wrapper of the layer that is bound to a name is
+    replaced by the function it wraps. A wrapper of the layer that is wrapped
+    by another layer is taken out of that layer's chain, so the other layer
+    keeps working.
+
+    Args:
+        package_name (str): Name of the package.
+        layer (str): Name of the layer, e.g. 'caching'.
+    """
+    prefix = package_name + '.'
+    modules = [module for name, module in list(sys.modules.items()) if
+               name == package_name or name.startswith(prefix)]
+    for module in modules:
+        for name, value in list(vars(module).items()):
+            outer = None
+            current = value
+            while getattr(current, LAYER_ATTR, None) is not None:
+                if getattr(current, LAYER_ATTR) == layer:
+                    if outer is None:
+                        setattr(module, name, current.__wrapped__)
+                    else:
+                        outer.__wrapped__ = current.__wrapped__
+                    break
+                outer, current = current, current.__wrapped__
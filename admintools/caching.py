@@ -0,0 +1,205 @@
+"""Opt-in caching of the validation and conversion functions."""
+
+import collections
+import functools
+import importlib
+import sys
+
+from ._wrapping import LAYER_ATTR, remove_layer
+
+
+# Functions that are cached, by submodule
+CACHED_FUNCTIONS = {
+    'conversion': ['convert_to_float', 'convert_to_int', 'convert_to_nan',
+                   'convert_to_value'],
+    'validation': ['check_email', 'check_email_2', 'check_is_float',
+                   'check_is_int', 'check_lead_zero'],
+}
+CACHE_POLICIES = ['lru', 'fifo']
+
+_caches = {}
+
+
+class _BoundedCache:
+    """Cache of results that holds at most maxsize entries.
+
+    When full, the least recently used entry ('lru') or the oldest entry
+    ('fifo') is removed to make room.
+    """
+
+    def __init__(self, maxsize, policy):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.data = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        """Remove all results and reset the stats."""
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+def _make_key(args, kwargs):
+    """Return a cache key for the arguments of a call.
+
+    String arguments are used as they are. Each other argument and keyword
+    value is keyed with _key_part so that, for example, 1, 1.0 and True, or
+    (1,) and (True,), are cached separately.
+
+    Args:
+        args (tuple): Positional arguments.
+        kwargs (dict): Keyword arguments.
+
+    Returns:
+        Cache key, which may not be hashable.
+    """
+    if len(args) == 1 and not kwargs:
+        arg = args[0]
+        return arg if type(arg) is str else _key_part(arg)
+    key = tuple([arg if type(arg) is str else _key_part(arg) for arg in
+                 args])
+    if kwargs:
+        key += tuple(sorted((name, _key_part(value)) for name, value in
+                            kwargs.items()))
+    return key
+
+
+def _key_part(arg):
+    """Return the part of a cache key for one argument.
+
+    The type of the argument is part of the key. Lists, tuples and sets are
+    keyed on the key part of each item, so their item types are included
+    too.
+
+    Args:
+        arg: Argument to be keyed.
+
+    Returns:
+        Key for the argument, which may not be hashable.
+    """
+    arg_type = type(arg)
+    if arg_type is str:
+        return arg
+    if arg_type is list or arg_type is tuple:
+        return (arg_type, tuple([item if type(item) is str else _key_part(
+                item) for item in arg]))
+    if arg_type is set or arg_type is frozenset:
+        return (arg_type, frozenset(map(_key_part, arg)))
+    return (arg_type, arg)
+
+
+def _cached(func, cache):
+    """Return a version of func that caches its results in cache.
+
+    Calls with arguments that cannot be hashed are not cached.
+
+    Args:
+        func (function): Function to be cached.
+        cache (_BoundedCache): Cache for the results.
+
+    Returns:
+        (function): Cached function.
+    """
+    data = cache.data
+    lru = cache.policy == 'lru'
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _make_key(args, kwargs)
+        try:
+            result = data[key]
+        except KeyError:
+            cache.misses += 1
+        except TypeError: # Unhashable arguments
+            return wrapper.__wrapped__(*args, **kwargs)
+        else:
+            cache.hits += 1
+            if lru:
+                data.move_to_end(key)
+            return result
+        result = wrapper.__wrapped__(*args, **kwargs)
+        data[key] = result
+        if len(data) > cache.maxsize:
+            data.popitem(last=False)
+            cache.evictions += 1
+        return result
+    setattr(wrapper, LAYER_ATTR, 'caching')
+    return wrapper
+
+
+def clear_caches():
+    """Remove all cached results and reset the cache stats.
+
+    Used between jobs so that results from one job are not kept in memory.
+    """
+    for cache in _caches.values():
+        cache.clear()
+
+
+def disable_caching():
+    """Stop caching and restore the original functions.
+
+    Cached functions that were first looked up on the package while caching
+    was enabled are also restored. If profiling is enabled, it is left in
+    place. Cached results and stats are discarded.
+    """
+    remove_layer(__package__, 'caching')
+    _caches.clear()
+
+
+def enable_caching(maxsize=100000, policy='lru'):
+    """Cache the results of the validation and conversion functions.
+
+    The functions in CACHED_FUNCTIONS give the same result each time they are
+    called with the same arguments, so repeated values such as the same email
+    address or grade are only checked once. Each function has its own cache
+    of at most maxsize results. Functions imported with from admintools
+    import ... before caching is enabled are not cached. Calling
+    enable_caching again replaces the caches with new empty ones.
+
+    Args:
+        maxsize (int): Largest number of results kept for each function.
+        policy (str): Which result is removed when a cache is full:
+            - 'lru' The least recently used result.
+            - 'fifo' The oldest result.
+
+    Raises:
+        ValueError: If maxsize is less than 1 or policy is not valid.
+    """
+    if maxsize < 1:
+        raise ValueError('maxsize must be at least 1')
+    if policy not in CACHE_POLICIES:
+        raise ValueError('policy must be one of {}'.format(CACHE_POLICIES))
+    disable_caching()
+    package = sys.modules[__package__]
+    for module_name, names in CACHED_FUNCTIONS.items():
+        module = importlib.import_module('.' + module_name, __package__)
+        for name in names:
+            func = getattr(module, name)
+            _caches[name] = _BoundedCache(maxsize, policy)
+            wrapper = _cached(func, _caches[name])
+            setattr(module, name, wrapper)
+            if vars(package).get(name) is func:
+                setattr(package, name, wrapper)
+
+
+def get_cache_stats():
+    """Return the hit and miss stats for each cached function.
+
+    Returns:
+        stats (dict): For each cached function, a dict with hits, misses,
+        hit_rate, evictions, size and maxsize. Empty if caching is not
+        enabled.
+    """
+    stats = {}
+    for name, cache in _caches.items():
+        calls = cache.hits + cache.misses
+        stats[name] = {'hits': cache.hits, 'misses': cache.misses,
+                       'hit_rate': cache.hits / calls if calls else 0.0,
+                       'evictions': cache.evictions, 'size': len(cache.data),
+                       'maxsize': cache.maxsize}
+    return stats
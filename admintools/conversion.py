@@ -0,0 +1,326 @@
+"""Conversion of values and columns of values."""
+
+import numpy as np
+import re
+
+from .tables import Table
+
+
+FLOAT_PATTERN = re.compile(r'\s*[+-]?(\d[\d_]*\.?[\d_]*|\.\d[\d_]*)'
+                           r'([eE][+-]?\d[\d_]*)?\s*|'
+                           r'\s*[+-]?(nan|inf|infinity)\s*', re.IGNORECASE)
+INT_PATTERN = re.compile(r'\s*[+-]?\d[\d_]*\s*')
+
+
+def _parse_numbers(items, parse, pattern, dtype, fill):
+    """Parse a sequence of items into a typed array and a validity mask.
+
+    Strings that do not match pattern cannot be parsed, so they are marked as
+    invalid without trying to parse them. Other items are parsed once.
+
+    Args:
+        items (iterable): Items to be parsed.
+        parse (function): float or int.
+        pattern (Pattern): Compiled pattern that parseable strings match.
+        dtype (type): Data type of the returned array.
+        fill (float or int): Value used for items that cannot be parsed.
+
+    Returns:
+        values (ndarray): Parsed values, with fill for invalid items.
+        valid (ndarray): True for each item that could be parsed.
+    """
+    match = pattern.fullmatch
+    values = []
+    valid = []
+    for item in items:
+        if isinstance(item, str) and match(item) is None:
+            values.append(fill)
+            valid.append(False)
+            continue
+        try:
+            value = parse(item)
+            if dtype is np.int64 and not -2**63 <= value < 2**63:
+                raise OverflowError
+        except (TypeError, ValueError, OverflowError):
+            values.append(fill)
+            valid.append(False)
+            continue
+        values.append(value)
+        valid.append(True)
+    return np.array(values, dtype=dtype), np.array(valid, dtype=bool)
+
+
+def _match_column(column, target_values):
+    """Return a boolean mask of column values found in target_values.
+
+    Values are compared as strings, as in convert_to_value, so missing values
+    match 'nan' or 'None'. target_values is converted to strings once and
+    each column value is converted once with str.
+
+    Args:
+        column (Series or ndarray): Values to be checked.
+        target_values (list): Values to be checked against.
+
+    Returns:
+        (ndarray): True where the column value is in target_values.
+    """
+    targets = set(map(str, target_values))
+    if hasattr(column, 'isin'): # pandas Series
+        return column.map(str).isin(targets).to_numpy(dtype=bool)
+    return np.fromiter((str(item) in targets for item in column), dtype=bool,
+                       count=len(column))
+
+
+def convert_column_to_nan(column, values, matching=True):
+    """Convert target strings in a column to NaN.
+    
+    Column version of convert_to_nan that gives the same result for each item,
+    without checking each item against values separately.
+    
+    Args:
+        column (Series or ndarray): Values to be checked. Each value is
+        converted to a string for checking.
+        values (list): Values to be checked. If found, NaN is returned (if 
+        matching=True) or the column value is returned. If matching=False,
+        this is reversed.
+        matching (bool): If True, matching values are returned as NaN and non-
+        matching are returned as passed. If False, non-matching values are
+        returned as NaN and matching values are returned as passed.
+        
+    Returns:
+        (Series or ndarray): New column of the same type as column.
+    """
+    return convert_column_to_value(column, values, np.nan, matching)
+
+
+def convert_column_to_value(column, target_values, value, matching=True):
+    """Convert target strings in a column to value.
+    
+    Column version of convert_to_value that gives the same result for each
+    item, without checking each item against target_values separately. An
+    ndarray is returned with an object dtype so that value can be stored
+    alongside the existing values.
+    
+    Args:
+        column (Series or ndarray): Values to be checked. Each value is
+        converted to a string for checking.
+        target_values (list): Values to be checked. If found, value is returned
+        (if matching=True) or the column value is returned. If matching=False,
+        this is reversed.
+        value (str): Value that is to be returned if taget_values check is
+        positive (respective to matching)
+        matching (bool): If True, matching values are returned as value and 
+        non-matching are returned as passed. If False, non-matching values are
+        returned as value and matching values are returned as passed.
+        
+    Returns:
+        (Series or ndarray): New column of the same type as column.
+    """
+    to_convert = _match_column(column, target_values)
+    if not matching:
+        to_convert = ~to_convert
+    if hasattr(column, 'mask'): # pandas Series
+        return column.mask(to_convert, value)
+    converted = np.array(column, dtype=object)
+    converted[to_convert] = value
+    return converted
+
+
+def convert_to_float(item):
+    """Convert a string to a float.
+    
+    Checks if an item can be converted to a float and returns it as a float if
+    it can. Returns False if it cannot be converted to float.
+    
+    Args:
+        item (str): String to be converted to a float.
+        
+    Returns:
+        item as a float.
+    """
+    try:
+        return float(item)
+    except ValueError:
+        return False
+
+
+def convert_to_floats(items, fill=np.nan):
+    """Convert a sequence of strings to floats.
+    
+    Bulk version of convert_to_float. Each item is parsed once and items that
+    cannot be converted are set to fill and flagged in the returned mask,
+    rather than being returned as False. Numeric arrays and columns are
+    converted directly.
+    
+    Args:
+        items (iterable): Strings to be converted to floats, such as a list or
+        a DataFrame column.
+        fill (float): Value used for items that cannot be converted.
+        
+    Returns:
+        values (ndarray): Items as floats.
+        valid (ndarray): True for each item that could be converted.
+    """
+    array = np.asarray(items) if hasattr(items, 'dtype') else None
+    if array is not None and array.dtype.kind in 'biuf':
+        return array.astype(float), np.ones(len(array), dtype=bool)
+    return _parse_numbers(items, float, FLOAT_PATTERN, float, fill)
+
+
+def convert_to_int(item):
+    """Convert a string to an integer.
+    
+    Checks if an item can be converted to an int and returns it as an int if it
+    can. Returns False if it cannot be converted to an int.
+    
+    Args:
+        item (str): String to be converted to an integer.
+        
+    Returns:
+        item as an integer.
+    """
+    try:
+        return int(item)
+    except ValueError:
+        return False
+
+
+def convert_to_ints(items, fill=0):
+    """Convert a sequence of strings to integers.
+    
+    Bulk version of convert_to_int. Each item is parsed once and items that
+    cannot be converted are set to fill and flagged in the returned mask,
+    rather than being returned as False. Numeric arrays and columns are
+    converted directly, with floats truncated as int() does. Values outside
+    the 64-bit integer range are flagged as invalid.
+    
+    Args:
+        items (iterable): Strings to be converted to integers, such as a list
+        or a DataFrame column.
+        fill (int): Value used for items that cannot be converted.
+        
+    Returns:
+        values (ndarray): Items as integers.
+        valid (ndarray): True for each item that could be converted.
+    """
+    array = np.asarray(items) if hasattr(items, 'dtype') else None
+    if array is not None and array.dtype.kind in 'biu':
+        return array.astype(np.int64), np.ones(len(array), dtype=bool)
+    if array is not None and array.dtype.kind == 'f':
+        valid = np.isfinite(array) & (np.abs(array) < 2.0**63)
+        values = np.where(valid, array, fill).astype(np.int64)
+        return values, valid
+    return _parse_numbers(items, int, INT_PATTERN, np.int64, fill)
+
+
+def convert_to_nan(item, values, matching=True):
+    """Convert target strings to NaN.
+    
+    Converts target strings listed in values to NaN so they can be processed
+    within a DataFrame, such as for removing specific rows. If matching=False,
+    strings that do not those listed in values are converted to NaN. Note that
+    it cannot take None as a value in values.
+    
+    Args:
+        item (str): String to be checked. item is converted to a string if
+        necessary.
+        values (list): Values to be checked. If found, NaN is returned (if 
+        matching=True) or item is returned. If matching=False, this is
+        reversed.
+        matching (bool): If True, matching values are returned as NaN and non-
+        matching are returned as passed (item). If False, non-matching values
+        are returned as NaN and matching values are returned as passed (item).
+        
+    Returns:
+        item or NaN (str): Depending on status of matching and if found or not.
+    """
+    # Convert to NaN if item is found in values
+    if matching:
+        if str(item) in map(str, values):
+            return np.nan
+        else:
+            return item
+        # Convert item to NaN if not found in values
+    else:
+        if str(item) in map(str, values):
+            return item
+        else:
+            return np.nan
+
+
+def convert_to_tuples(raw_data):
+    """Convert lists to tuples.
+
+    Takes a list of lists and converts each list to a tuple so that it can be
+    saved to a CSV file. To save data to a CSV file without making a copy of
+    it, use write_csv_rows.
+
+    Args:
+        raw_data (list or Table): Lists to be converted.
+
+    Returns:
+        processed_data (list): Data in tuples.
+    """
+    if isinstance(raw_data, Table):
+        return list(zip(*(column.tolist() for column in raw_data.columns)))
+    processed_data = []
+    for item in raw_data:
+        output_tuple = tuple(item)
+        processed_data.append(output_tuple)
+    return processed_data
+
+
+def convert_to_value(item, target_values, value, matching=True):
+    """Convert target strings to NaN.
+    
+    Converts target strings listed in target_values to value so they can be
+    processed within a DataFrame, such as for removing specific rows. If
+    matching=False, strings that do not those listed in values are converted to
+    value. Note that it cannot take None as a value in values.
+    
+    Args:
+        item (str): String to be checked. item is converted to a string if
+        necessary.
+        target_values (list): Values to be checked. If found, value is returned
+        (if matching=True) or item is returned. If matching=False, this is
+        reversed.
+        value (str): Value that is to be returned if taget_values check is
+        positive (respective to matching)
+        matching (bool): If True, matching values are returned as value and 
+        non-matching are returned as passed (item). If False, non-matching
+        values are returned as NaN and matching values are returned as passed
+        (item).
+        
+    Returns:
+        item or value (str): Depending on status of matching and if found or
+        not.
+    """
+    # Convert to value if item is found in taget_values
+    if matching:
+        if str(item) in map(str, target_values):
+            return value
+        else:
+            return item
+        # Convert item to value if not found in values
+    else:
+        if str(item) in map(str, target_values):
+            return item
+        else:
+            return value
+
+
+def replace_string(text, to_find, replacement):
+    """Search for items in strings and replace.
+
+    Search for characters or sequences of charaters in a string and replace
+    them i.e. replace all commas.
+
+    Args:
+        text (str): The string to be searched.
+        to_find (str): The character or sequence of characters to replace.
+        replacement (str): The string to replace the character(s) with.
+
+    Returns:
+        String with characters replaced.
+    """
+    return text.replace(to_find, replacement)
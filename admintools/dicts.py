@@ -0,0 +1,334 @@
+"""Dictionaries of counts and ordered items."""
+
+import collections
+import heapq
+import itertools
+import numpy as np
+
+
+# Dicts at least this size use NumPy to select the top k values
+ARRAY_SELECT_SIZE = 100000
+
+
+class Ordering:
+    """Canonical order of dictionary keys, worked out once for many dicts.
+
+    Built from a list of items in the desired order, like the items passed to
+    create_ordered_list, and reused to put many dictionaries in that order.
+    Iterating over an Ordering gives the items, so it can be passed to
+    create_ordered_list in place of the items list.
+
+    Attributes:
+        items (tuple): Keys in the desired order.
+        positions (dict): Position of each key, as from create_ordered_dict.
+    """
+
+    def __init__(self, items):
+        self.items = tuple(items)
+        self.positions = create_ordered_dict(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def to_matrix(self, dicts, default=np.nan, dtype=float):
+        """Return the values of many dicts as a 2D array.
+
+        Args:
+            dicts (iterable): Dictionaries to be ordered.
+            default: Value used for keys missing from a dict.
+            dtype (type): Data type of the array.
+
+        Returns:
+            (ndarray): One row per dict and one column per item.
+        """
+        rows = self.to_rows(dicts, default)
+        return np.array(rows, dtype=dtype).reshape(len(rows), len(self.items))
+
+    def to_pairs(self, data_dict):
+        """Return a dict as ordered [key, value] lists.
+
+        Gives the same result as create_ordered_list, leaving out keys that
+        are missing from data_dict.
+
+        Args:
+            data_dict (dict): Dictionary to be ordered.
+
+        Returns:
+            (list): Dictionary keys and values in an ordered list.
+        """
+        return [[item, data_dict[item]] for item in self.items if item in
+                data_dict]
+
+    def to_row(self, data_dict, default=None):
+        """Return the values of a dict in order.
+
+        Args:
+            data_dict (dict): Dictionary to be ordered.
+            default: Value used for keys missing from data_dict.
+
+        Returns:
+            (list): One value per item.
+        """
+        return list(map(data_dict.get, self.items, itertools.repeat(default)))
+
+    def to_rows(self, dicts, default=None):
+        """Return the values of many dicts in order.
+
+        Args:
+            dicts (iterable): Dictionaries to be ordered.
+            default: Value used for keys missing from a dict.
+
+        Returns:
+            (list): One row per dict, each with one value per item.
+        """
+        items = self.items
+        return [list(map(data_dict.get, items, itertools.repeat(default)))
+                for data_dict in dicts]
+
+
+def copy_dict_reset(source_dict):
+    """Copy a dictionary and reset values to 0.
+    
+    Args:
+        source_dict (dict): Dictionary to be copied.
+        
+    Returns:
+        new_dict (dict): New dictionary with values set to 0.
+    """
+    return dict.fromkeys(source_dict, 0)
+
+
+def count_items(items):
+    """Count the number of times each item appears.
+    
+    Integer and boolean arrays are counted with NumPy, using bincount when the
+    values are small non-negative integers. pandas categorical columns are
+    counted on their codes. Other items are counted with collections.Counter.
+    Only items that appear are included. The returned dictionary is in the
+    same format as update_dict and can be combined with merge_counts, such as
+    for counts made in separate processes.
+    
+    Args:
+        items (iterable): Items to be counted, such as a list, ndarray or
+        DataFrame column.
+    
+    Returns:
+        counts (dict): Number of times each item appears.
+    """
+    if hasattr(items, 'cat'): # pandas categorical Series
+        codes = np.asarray(items.cat.codes)
+        totals = np.bincount(codes[codes >= 0],
+                             minlength=len(items.cat.categories))
+        found = np.flatnonzero(totals)
+        return dict(zip(items.cat.categories[found].tolist(),
+                        totals[found].tolist()))
+    array = np.asarray(items) if hasattr(items, 'dtype') else None
+    if array is not None and array.dtype.kind in 'biu' and array.size:
+        if array.dtype.kind != 'b' and array.min() >= 0 and array.max() <= (
+                4 * array.size):
+            totals = np.bincount(array.ravel())
+            found = np.flatnonzero(totals)
+            return dict(zip(found.tolist(), totals[found].tolist()))
+        keys, totals = np.unique(array, return_counts=True)
+        return dict(zip(keys.tolist(), totals.tolist()))
+    return dict(collections.Counter(items))
+
+
+def create_dict(key_names):
+    """Create a dictionary with provided keys and set values to 0.
+    
+    Args:
+        key_names (list): Keys to be added to dictionary.
+        
+    Returns:
+        created_dict (dict): Dictionary with key values set to 0.
+    """
+    return dict.fromkeys(key_names, 0)
+
+
+def create_ordered_dict(items):
+    """Creates an ordered dictionary from a list of items.
+    
+    Each item is added to a dictionary. The position of the item is set as the
+    key value. These are set in the order that the items are supplied in the
+    items list. The dictionary can then be returned in order by iterating over
+    the dictionary keys and sorting on the key values.
+    
+    Args:
+        items (list) List of items in the desired order.
+        
+    Returns:
+        items_dict (dict): Ordered items in a dictionary.
+    """
+    items_dict = {}
+    n = 0
+    # Add each item to dictionary and set value to its position in list
+    for item in items:
+        items_dict[item] = n
+        n += 1
+    return items_dict
+
+
+def create_ordered_list(data_dict, items):
+    """Creates an ordered list from a dictionary.
+    
+    Each dictionary key + value is added to a list, as a nested list.
+    The position of the nested item is determined by the position of the key
+    value in the items list. The returned list is the dictionary ordered on the
+    keys.
+    
+    To put many dictionaries in the same order, create an Ordering from items
+    once and use its to_pairs, to_rows or to_matrix methods.
+    
+    Args:
+        data_dict (dict): Dictonary to be converted to an ordered list.
+        items (list or Ordering) List of dictionary keys in the desired order.
+        
+    Returns:
+        results (list): Dictionary keys and values in an ordered list.
+    """
+    return [[item, data_dict[item]] for item in items if item in data_dict]
+
+
+def merge_counts(*count_dicts, in_place=False):
+    """Add together dictionaries of counts.
+    
+    Used to combine counts made separately, such as from count_items run on
+    different parts of the data. The result is the same as counting all of the
+    data at once.
+    
+    Args:
+        count_dicts (dict): Dictionaries of counts to be added together.
+        in_place (bool): If True the counts are added to the first dictionary,
+        else a new dictionary is returned.
+    
+    Returns:
+        merged (dict): Total count for each key.
+    """
+    if in_place and count_dicts:
+        merged = count_dicts[0]
+        count_dicts = count_dicts[1:]
+    else:
+        merged = {}
+    for counts in count_dicts:
+        for key, count in counts.items():
+            merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+def seed_dict(source_data, data_dictionary, seed):
+    """Seed a dictionary with source data.
+    
+    Goes through a list of items and adds items not currently in
+    data_dictionary to the dictionary. Added items are seeded with the passed
+    seed. Updated dictionary is returned.
+    
+    Args:
+        soure_data (list): List of items to add to dictionary (if not present).
+        data_dictionary (dict): Dictionary to be updated.
+        seed (str or int): Seed value to be added to new dictionary items.
+    
+    Returns:
+        data_dictionary (dict): Updated dictionary.
+    """
+    for item in dict.fromkeys(source_data):
+        data_dictionary.setdefault(item, seed)
+    return data_dictionary
+
+
+def _select_values(dict_to_sort, k, descending, key):
+    """Return the top or bottom k items of a dict with numeric values.
+
+    Uses NumPy to find the k-th value, so that only items with a value at
+    least as good as it are sorted.
+
+    Args:
+        dict_to_sort (dict): Dict to select from.
+        k (int): Number of items to return.
+        descending (bool): If True the largest values are selected.
+        key (function): Sort key for the (key, value) items.
+
+    Returns:
+        (list): Selected items in sort order, or None if the values are not
+        all numeric.
+    """
+    values = np.array(list(dict_to_sort.values()))
+    if values.dtype.kind not in 'iuf' or np.isnan(values).any():
+        return None
+    if descending:
+        threshold = np.partition(values, len(values) - k)[len(values) - k]
+        candidates = np.flatnonzero(values >= threshold)
+    else:
+        threshold = np.partition(values, k - 1)[k - 1]
+        candidates = np.flatnonzero(values <= threshold)
+    keys = list(dict_to_sort)
+    selected = [(keys[i], dict_to_sort[keys[i]]) for i in candidates.tolist()]
+    return sorted(selected, key=key)[:k]
+
+
+def sort_dict_values(dict_to_sort, sort_order='descending', k=None):
+    """Sort a dic and return as a list of tuples.
+    
+    If k is given, only the first k items in the sort order are returned and
+    the rest of the dict is not sorted. Dicts of ARRAY_SELECT_SIZE or more
+    items with numeric values are selected from with NumPy. If sort_order is
+    not valid then False is returned. Must catch False returns when calling
+    the function.
+    
+    Args:
+        dict_to_sort (dict): Dict to sort.
+        sort_order (str): How the data should be sorted. Allowed options:
+            descending, ascending.
+        k (int): Number of items to return, or None to return all items.
+            
+    Returns:
+        orderd_list (list): Dict keys and values in required sort order.
+        
+    Source:
+        https://stackoverflow.com/questions/613183/how-do-i-sort-a-dictionary-
+        by-value
+    
+    Notes:
+        kv[0] is the key
+        kv[1] is the value
+        -kv returns in reverse order.
+    """
+    if sort_order == 'descending':
+        key = lambda kv: (-kv[1], kv[0])
+    elif sort_order == 'ascending':
+        key = lambda kv: (kv[1], kv[0])
+    else:
+        return False
+    if k is None or k >= len(dict_to_sort):
+        return sorted(dict_to_sort.items(), key=key)
+    if k <= 0:
+        return []
+    if len(dict_to_sort) >= ARRAY_SELECT_SIZE:
+        selected = _select_values(dict_to_sort, k, sort_order ==
+                                  'descending', key)
+        if selected is not None:
+            return selected
+    return heapq.nsmallest(k, dict_to_sort.items(), key=key)
+
+
+def update_dict(data_dict, update_list):
+    """Update the counts in a dictionary.
+    
+    Updates the counts (values) of a dictionary based on an update list. 
+    data_dict must be a dictionary where the value for each key is the count
+    of the appearance of each key in a set of data. Function adds to the count
+    of each key each time the key appears in the update_list. If a value in the
+    update key is not found it is added to the data_dict and set to 1.
+    
+    The items in update_list are counted in one batch with count_items before
+    being added to data_dict.
+    
+    Args:
+        data_dict (dict): Dictionary to be updated.
+        update_list (list): List of items to be counted and updated in
+        data_dict.
+    """
+    return merge_counts(data_dict, count_items(update_list), in_place=True)
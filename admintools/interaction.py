@@ -0,0 +1,251 @@
+"""Prompts for the user and debug output."""
+
+import collections
+import os
+
+
+# Set to 'y' or 'n' to answer prompts automatically with that default
+BATCH_ENV = 'ADMINTOOLS_BATCH'
+# Set to the path of a JSON batch config, see load_batch_config
+BATCH_FILE_ENV = 'ADMINTOOLS_BATCH_FILE'
+PROMPTS = ['check_action', 'check_repeat', 'check_repeat_help',
+           'confirm_files']
+
+_batch_mode = {}
+
+
+def _get_answer(prompt_name, prompt, message=None):
+    """Return the user's answer to a prompt, or the batch mode answer.
+
+    In batch mode, a scripted answer for message or prompt_name is used
+    first, else the default answer. confirm_files is always continued. Each
+    automatic answer is printed after the prompt and logged.
+
+    Args:
+        prompt_name (str): Name of the prompt function.
+        prompt (str): Text displayed to the user.
+        message (str): Message passed to check_action, or None.
+
+    Returns:
+        answer (str): Answer to the prompt.
+    """
+    if not _batch_mode:
+        return input(prompt)
+    import logging # Only loaded when needed
+    answers = _batch_mode['answers']
+    if prompt_name == 'confirm_files':
+        answer, source = '', 'auto-confirm'
+    elif message is not None and answers.get(message):
+        answer, source = answers[message].pop(0), 'scripted'
+    elif answers.get(prompt_name):
+        answer, source = answers[prompt_name].pop(0), 'scripted'
+    else:
+        answer, source = _batch_mode['default'], 'default'
+    print(prompt + answer)
+    logging.getLogger(__name__).info('Batch mode %s answer %r to %s: %s',
+                                     source, answer, prompt_name,
+                                     prompt.strip())
+    return answer
+
+
+def check_action(message):
+    """Check if user wishies to peform an action.
+
+    Gets user input and then returns True or False based on input. If input is
+    not valid, user is asked again until vaild input provided. Valid input is
+    'y' or 'n'.
+    
+    Args:
+        message (str): Message to be displayed to user.
+        
+    Returns:
+        True if user wants to perform the action, False otherwise.
+    """
+    repeat = ''
+    while repeat == '':
+        repeat = _get_answer('check_action', message + ' y or n: ', message)
+        if repeat.lower() not in ['y', 'n']:
+            print('\nThat is not a valid answer! Please try again.')
+            repeat = ''
+        elif repeat.lower() == 'y':
+            return True
+        else:
+            return False
+
+
+def check_repeat():
+    """Check if repeating with another action.
+
+    Gets user input and then returns True or False based on input. If input is
+    not valid, user is asked again until vaild input provided. Valid input is
+    'y' or 'n'.
+    
+    Returns:
+        True if user wants to perform another action, False otherwise.
+    """
+    repeat = ''
+    while repeat == '':
+        repeat = _get_answer('check_repeat', '\nDo you want to prepare '
+                             'another file? y/n --> ')
+        if repeat.lower() not in ['y', 'n']:
+            print('\nThat is not a valid answer! Please try again.')
+            repeat = ''
+        elif repeat.lower() == 'y':
+            return True
+        else:
+            return False
+
+
+def check_repeat_help():
+    """Check if repeating with another help action.
+
+    Gets user input and then returns True or False based on input. If input is
+    not valid, user is asked again until vaild input provided. Valid input is
+    'y' or 'n'.
+    
+    Returns:
+        True if user wants to perform another help action, False otherwise.
+    """
+    repeat = ''
+    while repeat == '':
+        repeat = _get_answer('check_repeat_help', '\nDo you want to view '
+                             'another help file entry? y/n --> ')
+        if repeat.lower() not in ['y', 'n']:
+            print('\nThat is not a valid answer! Please try again.')
+            repeat = ''
+        elif repeat.lower() == 'y':
+            return True
+        else:
+            return False
+
+
+def confirm_files(f_name, r_files, sort=False):
+    """Print required files and have user press enter to continue.
+    
+    Orders the list on alphabetical order prior to displaying.
+
+    Args:
+        f_name (str): Name of file that is being processed.
+        r_files (list): List of files that need to be present.
+        sort (bool): If True sorts returned list, else list returned in
+        order it is received.
+    """
+    if sort:
+        r_files.sort()
+    if len(r_files) == 1:
+        text_f = 'this file is'
+    else:
+        text_f = 'these files are'
+    print('\nTo process the {} the following files are required:\n'.format
+          (f_name))
+    for file in r_files:
+        print(file)
+    print('\nPlease make sure that {} in the required folder and are updated '
+          'correctly before proceeding.'.format(text_f))
+    _get_answer('confirm_files', '\nPress the enter key to continue '
+                'processing the {} file --> '.format(f_name))
+
+
+def debug_dict(test_dict):
+    """Print out contents of a dictionary.
+
+    Args:
+        test_dict (dict): Dictionary to be printed out.
+    
+    Dict test from https://stackoverflow.com/questions/25231989/how-to-check-if
+    -a-variable-is-a-dictionary-in-python
+    """
+    if isinstance(test_dict, collections.abc.Mapping):
+        for k, v in test_dict.items():
+            print(k, v)
+    else:
+        print('Passed object is not a dictionary')
+
+
+def debug_list(test_list):
+    """Print out contents of a list.
+    
+    Prints out the number of current item and its contents. Loops through
+    entire list.
+
+    Args:
+        test_list (list): List to be printed out.
+        
+    List test from https://stackoverflow.com/questions/1835018/how-to-check-if-
+    an-object-is-a-list-or-tuple-but-not-string
+    """
+    if isinstance(test_list, collections.abc.Sequence) and not isinstance(
+            test_list, str):
+        i = 0
+        for item in test_list:
+            print('Item {}'.format(i))
+            print(str(item))
+            i += 1
+    else:
+        print('Passed object is not a list')
+
+
+def debug_list_item(test_item):
+    """Print out a single list item.
+
+    Args:
+        test_item (string): Item to be printed.
+    """
+    print(test_item)
+
+
+def disable_batch_mode():
+    """Turn off batch mode so that prompts wait for the user again."""
+    _batch_mode.clear()
+
+
+def enable_batch_mode(answers=None, default='n'):
+    """Answer check_action, check_repeat and check_repeat_help automatically.
+    
+    Used to run scripts without an operator. Each prompt uses the next
+    scripted answer for its check_action message, then the next for its
+    function name, and then the default answer. confirm_files is always
+    continued. Each automatic answer is printed after the prompt and logged
+    at INFO level.
+    Batch mode can also be turned on at import with the ADMINTOOLS_BATCH or
+    ADMINTOOLS_BATCH_FILE environment variables.
+    
+    Args:
+        answers (dict): Lists of 'y' or 'n' answers, keyed on a function name
+        in PROMPTS or on a message passed to check_action.
+        default (str): 'y' or 'n', used when there is no scripted answer.
+        Defaults to 'n' so that check_repeat loops finish.
+    
+    Raises:
+        ValueError: If an answer is not 'y' or 'n'.
+    """
+    answers = {key: list(values) for key, values in (answers or {}).items()}
+    for answer in [default] + [answer for values in answers.values() for
+                               answer in values]:
+        if str(answer).lower() not in ['y', 'n']:
+            raise ValueError('Batch mode answers must be y or n, not '
+                             '{!r}'.format(answer))
+    _batch_mode.clear()
+    _batch_mode.update(answers=answers, default=default)
+
+
+def load_batch_config(file_name):
+    """Turn on batch mode using a JSON config file.
+    
+    The file holds an object with optional "answers" and "default" values,
+    as for enable_batch_mode. For example:
+        {"default": "n", "answers": {"check_repeat": ["y", "y"]}}
+    
+    Args:
+        file_name (str): Path of the config file.
+    """
+    import json # Only loaded when needed
+    with open(file_name, encoding='utf-8') as f:
+        config = json.load(f)
+    enable_batch_mode(config.get('answers'), config.get('default', 'n'))
+
+
+if os.environ.get(BATCH_FILE_ENV):
+    load_batch_config(os.environ[BATCH_FILE_ENV])
+elif os.environ.get(BATCH_ENV):
+    enable_batch_mode(default=os.environ[BATCH_ENV])
@@ -0,0 +1,248 @@
+"""Running helpers on chunks of data in a process pool."""
+
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+from multiprocessing import shared_memory
+import numpy as np
+import os
+
+from .tables import Table
+
+
+def _apply_chunk(func, chunk, args, kwargs):
+    """Run func on a chunk of data in a worker process.
+
+    Args:
+        func (function): Function to run.
+        chunk (list or ndarray): Part of the data.
+        args (tuple): Other positional arguments for func.
+        kwargs (dict): Keyword arguments for func.
+
+    Returns:
+        Result of func for the chunk.
+    """
+    return func(chunk, *args, **kwargs)
+
+
+def _apply_shared_chunk(func, shm_name, shape, dtype, start, stop, args,
+                        kwargs):
+    """Run func on part of an array held in shared memory.
+
+    Args:
+        func (function): Function to run.
+        shm_name (str): Name of the shared memory block.
+        shape (tuple): Shape of the whole array.
+        dtype (dtype): Data type of the array.
+        start (int): Position of the first row of the chunk.
+        stop (int): Position after the last row of the chunk.
+        args (tuple): Other positional arguments for func.
+        kwargs (dict): Keyword arguments for func.
+
+    Returns:
+        Result of func for the chunk.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    result = func(array[start:stop], *args, **kwargs)
+    # Results must not refer to the shared memory once it is closed
+    if isinstance(result, np.ndarray) and np.shares_memory(result, array):
+        result = result.copy()
+    del array
+    shm.close()
+    return result
+
+
+def _filter_items(chunk, func, args, kwargs):
+    """Return the items in chunk for which func returns True.
+
+    Args:
+        chunk (list): Items to be checked.
+        func (function): Function called with each item.
+        args (tuple): Other positional arguments for func.
+        kwargs (dict): Keyword arguments for func.
+
+    Returns:
+        (list): Items kept.
+    """
+    return [item for item in chunk if func(item, *args, **kwargs)]
+
+
+def _join_results(results):
+    """Join the results for each chunk in their original order.
+
+    Arrays, Tables, pandas objects and lists are joined into one of the same
+    kind. Tuples, such as the (values, valid) result of convert_to_floats,
+    are joined item by item.
+
+    Args:
+        results (list): Result for each chunk.
+
+    Returns:
+        (list, ndarray, Table, Series or tuple): Joined results.
+
+    Raises:
+        TypeError: If the results cannot be joined.
+    """
+    if all(isinstance(result, np.ndarray) for result in results):
+        return np.concatenate(results)
+    if all(isinstance(result, Table) for result in results):
+        return Table([np.concatenate(columns) for columns in zip(*(
+                     result.columns for result in results))],
+                     results[0].header)
+    if all(isinstance(result, tuple) for result in results) and len(set(
+            map(len, results))) == 1:
+        return tuple(_join_results(list(parts)) for parts in zip(*results))
+    if all(isinstance(result, list) for result in results):
+        return list(itertools.chain.from_iterable(results))
+    if all(hasattr(result, 'iloc') for result in results):
+        import pandas as pd # Only loaded for pandas results
+        return pd.concat(results)
+    raise TypeError('Cannot join chunk results of type {}'.format(', '.join(
+                    sorted(set(type(result).__name__ for result in
+                               results)))))
+
+
+def _map_items(chunk, func, args, kwargs):
+    """Return func applied to each item in chunk.
+
+    Args:
+        chunk (list): Items to be processed.
+        func (function): Function called with each item.
+        args (tuple): Other positional arguments for func.
+        kwargs (dict): Keyword arguments for func.
+
+    Returns:
+        (list): Result for each item.
+    """
+    return [func(item, *args, **kwargs) for item in chunk]
+
+
+def _take_chunk(data, start, stop):
+    """Return the rows of data from start up to stop.
+
+    Args:
+        data (list, ndarray or Table): Data to be split up.
+        start (int): Position of the first row of the chunk.
+        stop (int): Position after the last row of the chunk.
+
+    Returns:
+        (list, ndarray or Table): Rows of the chunk.
+    """
+    if isinstance(data, Table):
+        return data.take(range(start, min(stop, len(data))))
+    return data[start:stop]
+
+
+def parallel_apply(func, data, *args, workers=None, chunk_size=100000,
+                   min_size=None, **kwargs):
+    """Run a helper on chunks of data in a process pool.
+    
+    data is split into chunks of chunk_size rows and func(chunk, *args,
+    **kwargs) is run on each chunk in a separate process. The results are
+    joined in the original order, so func must be a function whose result for
+    the whole of data is the chunk results joined together, such as
+    find_items, extract_list_item or convert_column_to_value. Numeric arrays
+    are passed to the workers through shared memory rather than being copied.
+    A Table is split into Tables, and Table results are joined into a Table.
+    If data has no more than min_size rows, or workers is 1, func is run on
+    data without a process pool. func must be defined at the top level of a
+    module so that it can be sent to the workers.
+    
+    Args:
+        func (function): Function that takes the data as its first argument.
+        data (list, ndarray or Table): Data to be processed.
+        args: Other positional arguments for func.
+        workers (int): Number of processes, defaults to the number of CPUs.
+        chunk_size (int): Number of rows in each chunk.
+        min_size (int): Largest data size that is processed without a process
+        pool, defaults to chunk_size.
+        kwargs: Keyword arguments for func.
+    
+    Returns:
+        (list, ndarray, Table, Series or tuple): Joined results for each
+        chunk.
+    
+    Raises:
+        TypeError: If the chunk results are not all of a kind that can be
+        joined.
+    """
+    workers = workers or os.cpu_count() or 1
+    if min_size is None:
+        min_size = chunk_size
+    if workers == 1 or len(data) <= min_size:
+        return func(data, *args, **kwargs)
+    starts = range(0, len(data), chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if isinstance(data, np.ndarray) and data.dtype.kind in 'biufcmM':
+            shm = shared_memory.SharedMemory(create=True, size=max(
+                                             data.nbytes, 1))
+            try:
+                shared = np.ndarray(data.shape, dtype=data.dtype,
+                                    buffer=shm.buf)
+                shared[:] = data
+                futures = [executor.submit(_apply_shared_chunk, func,
+                           shm.name, data.shape, data.dtype, start,
+                           start + chunk_size, args, kwargs) for start in
+                           starts]
+                results = [future.result() for future in futures]
+                del shared
+            finally:
+                shm.close()
+                shm.unlink()
+        else:
+            futures = [executor.submit(_apply_chunk, func, _take_chunk(
+                       data, start, start + chunk_size), args, kwargs) for
+                       start in starts]
+            results = [future.result() for future in futures]
+    return _join_results(results)
+
+
+def parallel_filter(func, items, *args, workers=None, chunk_size=100000,
+                    min_size=None, **kwargs):
+    """Keep the items for which func returns True, using a process pool.
+    
+    func(item, *args, **kwargs) is called for each item, such as check_email.
+    See parallel_apply for how the items are split up.
+    
+    Args:
+        func (function): Function that takes an item as its first argument.
+        items (list): Items to be checked.
+        args: Other positional arguments for func.
+        workers (int): Number of processes, defaults to the number of CPUs.
+        chunk_size (int): Number of items in each chunk.
+        min_size (int): Largest number of items that is processed without a
+        process pool, defaults to chunk_size.
+        kwargs: Keyword arguments for func.
+    
+    Returns:
+        (list): Items kept, in their original order.
+    """
+    return parallel_apply(_filter_items, items, func, args, kwargs,
+                          workers=workers, chunk_size=chunk_size,
+                          min_size=min_size)
+
+
+def parallel_map(func, items, *args, workers=None, chunk_size=100000,
+                 min_size=None, **kwargs):
+    """Apply func to each item, using a process pool.
+    
+    func(item, *args, **kwargs) is called for each item, such as
+    convert_to_value or check_email. See parallel_apply for how the items are
+    split up.
+    
+    Args:
+        func (function): Function that takes an item as its first argument.
+        items (list): Items to be processed.
+        args: Other positional arguments for func.
+        workers (int): Number of processes, defaults to the number of CPUs.
+        chunk_size (int): Number of items in each chunk.
+        min_size (int): Largest number of items that is processed without a
+        process pool, defaults to chunk_size.
+        kwargs: Keyword arguments for func.
+    
+    Returns:
+        (list): Result for each item, in the original order.
+    """
+    return parallel_apply(_map_items, items, func, args, kwargs,
+                          workers=workers, chunk_size=chunk_size,
+                          min_size=min_size)
@@ -0,0 +1,162 @@
+"""Opt-in profiling of the admintools functions."""
+
+import atexit
+import functools
+import importlib
+import inspect
+import json
+import os
+import sys
+import time
+
+from ._wrapping import LAYER_ATTR, remove_layer
+
+
+# Set to any value to profile admintools functions from import
+PROFILE_ENV = 'ADMINTOOLS_PROFILE'
+# Optional file that profile stats are written to at exit
+PROFILE_FILE_ENV = 'ADMINTOOLS_PROFILE_FILE'
+# Submodules with functions that are profiled
+PROFILED_MODULES = ['conversion', 'dicts', 'interaction', 'parallel',
+                    'tables', 'validation']
+
+_profile_stats = {}
+_wrappers = {}
+
+
+def _profiled(func):
+    """Return a version of func that records profile stats for each call.
+
+    Args:
+        func (function): Function to be profiled.
+
+    Returns:
+        (function): Profiled function.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return wrapper.__wrapped__(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = _profile_stats.get(name)
+            if stats is None:
+                stats = _profile_stats[name] = {'calls': 0, 'total_time': 0.0,
+                                                'max_time': 0.0,
+                                                'total_size': 0,
+                                                'max_size': 0}
+            stats['calls'] += 1
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+            if args and hasattr(args[0], '__len__'):
+                size = len(args[0])
+                stats['total_size'] += size
+                stats['max_size'] = max(stats['max_size'], size)
+    setattr(wrapper, LAYER_ATTR, 'profiling')
+    return wrapper
+
+
+def disable_profiling():
+    """Stop recording profile stats for admintools functions.
+    
+    Restores the original functions so that they run without any profiling
+    overhead, including functions first looked up on the package while
+    profiling was enabled. If caching is enabled, it is left in place.
+    Recorded stats are kept until reset_profile_stats is called.
+    """
+    remove_layer(__package__, 'profiling')
+    _wrappers.clear()
+
+
+def enable_profiling():
+    """Start recording profile stats for admintools functions.
+    
+    Replaces each public function in the admintools submodules with a version
+    that records the number of calls, total and longest wall time, and the
+    total and largest size of the first argument. All of the submodules are
+    loaded. Profiling can also be turned on at import by setting the
+    ADMINTOOLS_PROFILE environment variable. Functions imported with from
+    admintools import ... before profiling is enabled are not profiled. For
+    functions that return a generator, only the time taken to create the
+    generator is recorded.
+    """
+    if _wrappers: # Already enabled
+        return
+    package = sys.modules[__package__]
+    modules = [package] + [importlib.import_module('.' + name, __package__)
+                           for name in PROFILED_MODULES]
+    module_names = ['{}.{}'.format(__package__, name) for name in
+                    PROFILED_MODULES]
+    for module in modules:
+        for name, func in list(vars(module).items()):
+            if (name.startswith('_') or not inspect.isfunction(func) or
+                    func.__module__ not in module_names):
+                continue
+            if func not in _wrappers:
+                _wrappers[func] = _profiled(func)
+            setattr(module, name, _wrappers[func])
+
+
+def get_profile_stats():
+    """Return the profile stats recorded since profiling was enabled.
+    
+    Returns:
+        stats (dict): For each function called, a dict with calls,
+        total_time, max_time, mean_time, total_size and max_size. Times are
+        in seconds and sizes are the length of the first argument.
+    """
+    stats = {}
+    for name, func_stats in _profile_stats.items():
+        stats[name] = dict(func_stats)
+        stats[name]['mean_time'] = func_stats['total_time'] / func_stats[
+            'calls']
+    return stats
+
+
+def reset_profile_stats():
+    """Clear the recorded profile stats."""
+    _profile_stats.clear()
+
+
+def write_profile_stats(file_name=None, output_format='text'):
+    """Write the recorded profile stats as text or JSON.
+    
+    Functions are listed from the most to the least total time.
+    
+    Args:
+        file_name (str): Path of the file to write to. If None, the stats are
+        written to stderr.
+        output_format (str): 'text' for a table or 'json'.
+    """
+    stats = get_profile_stats()
+    if output_format == 'json':
+        output = json.dumps(stats, indent=2, sort_keys=True)
+    else:
+        lines = ['{:<28}{:>10}{:>12}{:>12}{:>12}{:>12}'.format(
+                 'function', 'calls', 'total (s)', 'max (s)', 'mean size',
+                 'max size')]
+        for name, func_stats in sorted(stats.items(), key=lambda kv:
+                                       -kv[1]['total_time']):
+            lines.append('{:<28}{:>10}{:>12.4f}{:>12.4f}{:>12.0f}{:>12}'
+                         .format(name, func_stats['calls'],
+                                 func_stats['total_time'],
+                                 func_stats['max_time'],
+                                 func_stats['total_size'] /
+                                 func_stats['calls'], func_stats['max_size']))
+        output = '\n'.join(lines)
+    if file_name is None:
+        print(output, file=sys.stderr)
+    else:
+        with open(file_name, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+
+
+if os.environ.get(PROFILE_ENV):
+    enable_profiling()
+    _profile_file = os.environ.get(PROFILE_FILE_ENV)
+    atexit.register(write_profile_stats, _profile_file, 'json' if
+                    _profile_file and _profile_file.endswith('.json') else
+                    'text')
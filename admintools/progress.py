@@ -0,0 +1,150 @@
+"""Rate-limited progress reporting for long-running helpers."""
+
+import itertools
+import sys
+import time
+
+
+# Least number of seconds between two progress updates
+PROGRESS_INTERVAL = 0.2
+# Least change in percent between two updates on a terminal
+PROGRESS_STEP = 1
+# Least change in percent between two updates when output is not a terminal
+PROGRESS_LOG_STEP = 10
+# Number of chunks that Progress.chunks splits data into
+PROGRESS_CHUNKS = 1000
+
+_settings = {'reporter': 'auto'}
+
+
+class Progress:
+    """Report the progress of a long-running task.
+
+    Updates are rate limited so that reporting costs little however many
+    items are processed: an update is only made once the percent complete
+    has moved on by the step and at least PROGRESS_INTERVAL seconds have
+    passed. How updates are reported is set with set_progress. With the
+    default 'auto' reporter, progress is shown on one line of a terminal, or
+    as a line every PROGRESS_LOG_STEP percent when output is redirected to a
+    file or log.
+
+    Helpers process data with chunks, or call update with the number of
+    items done so far, and call finish at the end.
+    """
+
+    def __init__(self, total, message='Processing items'):
+        """Start reporting a task.
+
+        Args:
+            total (int): Number of items in the task.
+            message (str): Description of the task.
+        """
+        self.total = total
+        self.message = message
+        self.reporter = _settings['reporter']
+        self.terminal = False
+        step = _settings.get('step')
+        if self.reporter == 'auto':
+            isatty = getattr(sys.stdout, 'isatty', None)
+            self.terminal = bool(isatty and isatty())
+            if step is None:
+                step = PROGRESS_STEP if self.terminal else PROGRESS_LOG_STEP
+            print('\n' + message if self.terminal else message)
+        self.step = step or PROGRESS_STEP
+        interval = _settings.get('interval')
+        self.interval = PROGRESS_INTERVAL if interval is None else interval
+        self._last_percent = -1
+        self._next_percent = 0
+        self._next_time = 0
+        self._reported = -1
+
+    def chunks(self, data):
+        """Yield data in chunks, updating progress after each chunk.
+
+        Processing a chunk at a time keeps the cost of tracking progress
+        out of the loop over items.
+
+        Args:
+            data (list): Items to be processed. Any iterable can be used,
+            but chunks of a list are taken by slicing.
+
+        Yields:
+            chunk (list): Next items in data.
+        """
+        size = max(1, self.total // PROGRESS_CHUNKS)
+        if isinstance(data, list):
+            for start in range(0, len(data), size):
+                yield data[start:start + size]
+                self.update(min(start + size, self.total))
+            return
+        items = iter(data)
+        done = 0
+        for chunk in iter(lambda: list(itertools.islice(items, size)), []):
+            yield chunk
+            done += len(chunk)
+            self.update(done)
+
+    def finish(self):
+        """Report that the task is complete."""
+        if self._reported != self.total:
+            self._report(self.total, 100)
+        if self.reporter == 'auto':
+            if self.terminal:
+                print('\rFinished ' + self.message[:1].lower() +
+                      self.message[1:])
+            else:
+                print('Finished ' + self.message[:1].lower() +
+                      self.message[1:])
+
+    def update(self, done):
+        """Report that done items have been processed, if an update is due.
+
+        Args:
+            done (int): Number of items processed so far.
+        """
+        percent = done * 100 // self.total if self.total else 100
+        if percent < self._next_percent:
+            return
+        now = time.monotonic()
+        if now < self._next_time and done < self.total:
+            return
+        self._next_time = now + self.interval
+        self._next_percent = percent + self.step
+        self._report(done, percent)
+
+    def _report(self, done, percent):
+        """Send an update to the reporter."""
+        self._reported = done
+        if self.reporter is None:
+            return
+        if self.reporter != 'auto':
+            self.reporter(self.message, done, self.total)
+        elif percent != self._last_percent:
+            if self.terminal:
+                print('\rProgress: {}%'.format(percent), end='', flush=True)
+            else:
+                print('Progress: {}%'.format(percent), flush=True)
+        self._last_percent = percent
+
+
+def set_progress(reporter='auto', interval=None, step=None):
+    """Set how the progress of long-running helpers is reported.
+
+    Args:
+        reporter: How updates are reported:
+            - 'auto' Printed on one line of a terminal, or as a line every
+              PROGRESS_LOG_STEP percent when output is not a terminal.
+            - None Progress is not reported.
+            - A function called as reporter(message, done, total).
+        interval (float): Least number of seconds between updates, or None
+        for PROGRESS_INTERVAL.
+        step (int): Least change in percent between updates, or None for the
+        default for the reporter.
+
+    Raises:
+        ValueError: If reporter is not 'auto', None or callable.
+    """
+    if reporter not in ('auto', None) and not callable(reporter):
+        raise ValueError("reporter must be 'auto', None or a function")
+    _settings.clear()
+    _settings.update(reporter=reporter, interval=interval, step=step)
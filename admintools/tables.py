@@ -0,0 +1,1554 @@
+"""Report data held as lists, lists of lists or Tables."""
+
+import bz2
+import collections
+import csv
+import gzip
+import heapq
+import itertools
+import lzma
+import mmap
+import numpy as np
+import operator
+import os
+import re
+import sys
+import tempfile
+
+from .progress import Progress
+from .validation import check_is_int
+
+
+# Number of rows sent to the CSV writer at a time
+CSV_CHUNK_SIZE = 10000
+# Size in bytes of the buffer for uncompressed CSV files
+CSV_BUFFER_SIZE = 1024 * 1024
+# Number of IDs sorted in memory at a time by sort_id_file
+SORT_CHUNK_SIZE = 1000000
+# Number of rows made at a time when iterating over a Table
+TABLE_CHUNK_SIZE = 10000
+JOIN_METHODS = ['hash', 'merge']
+JOIN_TYPES = ['inner', 'left', 'anti']
+
+_UNHASHABLE = object() # Tags the keys of unhashable items
+
+
+def _make_lookup(items):
+    """Return a membership test backed by a hash index over items.
+
+    Falls back to checking the original list if an item is unhashable (such as
+    a nested list), in which case that membership test is linear.
+
+    Args:
+        items (list): Items to be indexed.
+
+    Returns:
+        (function): Takes an item and returns True if it is in items.
+    """
+    items = list(items)
+    try:
+        index = set(items)
+    except TypeError:
+        return items.__contains__
+
+    def lookup(item):
+        try:
+            return item in index
+        except TypeError:
+            return item in items
+    return lookup
+
+
+def _column_positions(num_columns, columns, keep, header):
+    """Return the positions of the columns kept by a projection.
+
+    Args:
+        num_columns (int): Number of columns in each row.
+        columns (list): Positions or header names of the columns.
+        keep (bool): If True the columns are kept, else they are dropped.
+        header (list): Column names, needed if columns has names.
+
+    Returns:
+        positions (list): Positions of the columns to keep, in output order.
+    """
+    if isinstance(columns, (int, str)):
+        columns = [columns]
+    chosen = [header.index(column) if isinstance(column, str) else
+              range(num_columns)[column] for column in columns]
+    if keep:
+        return chosen
+    dropped = set(chosen)
+    return [pos for pos in range(num_columns) if pos not in dropped]
+
+
+def _drop_column(rows, column_pos):
+    """Yield each row without the value at column_pos.
+
+    Each row is handled on its own, so rows may have different lengths, as
+    in the output of csv.reader. Records are projected to a record type
+    without the column.
+
+    Args:
+        rows (iterable): Rows to be processed.
+        column_pos (int): Position of the column to be removed.
+
+    Yields:
+        (list or record): New row without the column.
+    """
+    projectors = {}
+    for row in rows:
+        if isinstance(row, list):
+            row = row[:]
+            del row[column_pos]
+            yield row
+        elif _record_header(row) is not None:
+            row_type = type(row)
+            if row_type not in projectors:
+                projectors[row_type] = _row_projector(row, [column_pos],
+                                                      False, None)
+            yield projectors[row_type](row)
+        else:
+            row = list(row)
+            del row[column_pos]
+            yield row
+
+
+def _hash_join(left, right, left_key, right_key, how, fill):
+    """Yield joined rows, looking up each left row in a hash of right.
+
+    Right rows are kept as they are, with the first row for each key in one
+    dict and any further rows in another, so that no list is created for
+    each key.
+
+    Args:
+        left (iterable): Rows to be probed, read once.
+        right (iterable): Rows to be hashed on right_key.
+        left_key (list): Positions of the key columns in left.
+        right_key (list): Positions of the key columns in right.
+        how (str): Join type, see join_rows.
+        fill: Value for right columns of left rows with no match.
+
+    Yields:
+        (list): Joined rows.
+    """
+    get_left_key = operator.itemgetter(*left_key)
+    get_right_key = operator.itemgetter(*right_key)
+    if how == 'anti':
+        keys = set(map(get_right_key, right))
+        for row in left:
+            if get_left_key(row) not in keys:
+                yield row
+        return
+    right = iter(right)
+    first = next(right, None)
+    get_extra, padding = _join_extra(first, right_key, fill)
+    index = {}
+    more = {}
+    if first is not None:
+        for row in itertools.chain([first], right):
+            key = get_right_key(row)
+            if key in index:
+                more.setdefault(key, []).append(row)
+            else:
+                index[key] = row
+    get_match = index.get
+    for row in left:
+        key = get_left_key(row)
+        match = get_match(key)
+        if match is not None:
+            yield [*row, *get_extra(match)]
+            if more and key in more:
+                for match in more[key]:
+                    yield [*row, *get_extra(match)]
+        elif how == 'left':
+            yield [*row, *padding]
+
+
+def _join_extra(row, key_columns, fill):
+    """Return a getter for the non-key columns of a row and padding for them.
+
+    Args:
+        row (list): First row of the right side, or None if it is empty.
+        key_columns (list): Positions of the key columns.
+        fill: Value used for padding.
+
+    Returns:
+        (tuple): Function that returns the non-key values of a row as a
+        tuple, and a list of fill of the same length.
+    """
+    if row is None:
+        return (lambda row: ()), []
+    keys = set(range(len(row))[pos] for pos in key_columns)
+    positions = [pos for pos in range(len(row)) if pos not in keys]
+    if len(positions) == 1:
+        pos = positions[0]
+        get_extra = lambda row: (row[pos],)
+    elif positions:
+        get_extra = operator.itemgetter(*positions)
+    else:
+        get_extra = lambda row: ()
+    return get_extra, [fill] * len(positions)
+
+
+def _merge_join(left, right, left_key, right_key, how, fill):
+    """Yield joined rows from left and right sorted on their keys.
+
+    Each side is read once, so both can be iterators.
+
+    Args:
+        left (iterable): Rows sorted on left_key.
+        right (iterable): Rows sorted on right_key.
+        left_key (list): Positions of the key columns in left.
+        right_key (list): Positions of the key columns in right.
+        how (str): Join type, see join_rows.
+        fill: Value for right columns of left rows with no match.
+
+    Yields:
+        (list): Joined rows.
+    """
+    get_left_key = operator.itemgetter(*left_key)
+    get_right_key = operator.itemgetter(*right_key)
+    right = iter(right)
+    current = next(right, None)
+    get_extra, padding = _join_extra(current, right_key, fill)
+    group_key = group = None
+    for row in left:
+        key = get_left_key(row)
+        if group is None or key != group_key:
+            while current is not None and get_right_key(current) < key:
+                current = next(right, None)
+            group_key, group = key, []
+            while current is not None and get_right_key(current) == key:
+                group.append(get_extra(current))
+                current = next(right, None)
+        if how == 'anti':
+            if not group:
+                yield row
+        elif group:
+            for extra in group:
+                yield [*row, *extra]
+        elif how == 'left':
+            yield [*row, *padding]
+
+
+def _open_csv(file_name, mode, compression):
+    """Open a CSV file as text, compressed or not.
+
+    Args:
+        file_name (str or PathLike): Path of the file.
+        mode (str): 'r' to read or 'w' to write.
+        compression (str): 'gzip', 'bz2', 'xz', None for no compression, or
+        'infer' to use the file extension (.gz, .bz2 or .xz).
+
+    Returns:
+        (file): Open text file.
+    """
+    if compression == 'infer':
+        compression = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}.get(
+            os.path.splitext(os.fsdecode(file_name))[1].lower())
+    openers = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+    if compression is None:
+        return open(file_name, mode, newline='', encoding='utf-8',
+                    buffering=CSV_BUFFER_SIZE)
+    return openers[compression](file_name, mode + 't', newline='',
+                                encoding='utf-8')
+
+
+def _compare_id_files(source_file, target_file, output_file, is_sorted,
+                      record_width, keep_common):
+    """Write IDs in source_file that are, or are not, in target_file.
+
+    Args:
+        source_file (str): Path of the file of IDs to be checked.
+        target_file (str): Path of the file of IDs to check against.
+        output_file (str): Path of the file the IDs are written to.
+        is_sorted (bool): If False both files are sorted first.
+        record_width (int): Bytes per ID for fixed-width files, or None for
+        one ID per line.
+        keep_common (bool): If True IDs found in target_file are written,
+        else IDs not found are written.
+
+    Returns:
+        num_ids (int): Number of IDs written.
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        if not is_sorted:
+            sorted_source = os.path.join(folder, 'source.txt')
+            sorted_target = os.path.join(folder, 'target.txt')
+            sort_id_file(source_file, sorted_source, record_width)
+            sort_id_file(target_file, sorted_target, record_width)
+            source_file, target_file = sorted_source, sorted_target
+            record_width = None
+        ids = _merge_ids(_iter_ids(source_file, record_width),
+                         _iter_ids(target_file, record_width), keep_common)
+        return _write_ids(ids, output_file)
+
+
+def _item_key(item):
+    """Return a hashable key that compares equal for equal items.
+
+    Hashable items are their own key. Other items are keyed on their type
+    and the keys of their contents, tagged so that they cannot match a
+    hashable item.
+
+    Args:
+        item: Item to be keyed.
+
+    Returns:
+        Hashable key for item.
+    """
+    try:
+        hash(item)
+        return item
+    except TypeError:
+        pass
+    if isinstance(item, collections.abc.Mapping):
+        contents = frozenset((key, _item_key(value)) for key, value in
+                             item.items())
+    elif isinstance(item, (set, frozenset)):
+        contents = frozenset(item)
+    else:
+        contents = tuple(map(_item_key, item))
+    return (_UNHASHABLE, type(item), contents)
+
+
+def _iter_ids(file_name, record_width=None):
+    """Yield the IDs in a file using memory-mapped reads.
+
+    Surrounding whitespace is removed and blank IDs are skipped.
+
+    Args:
+        file_name (str): Path of the file of IDs.
+        record_width (int): Bytes per ID for fixed-width files, including any
+        line ending, or None for one ID per line.
+
+    Yields:
+        (bytes): Each ID.
+    """
+    with open(file_name, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            if record_width:
+                records = (m[start:start + record_width] for start in range(
+                           0, len(m), record_width))
+            else:
+                records = iter(m.readline, b'')
+            for record in records:
+                record = record.strip()
+                if record:
+                    yield record
+
+
+def _merge_ids(source, target, keep_common):
+    """Yield IDs in source that are, or are not, in target.
+
+    Both source and target must be sorted. Each is read once.
+
+    Args:
+        source (iterator): Sorted IDs to be checked.
+        target (iterator): Sorted IDs to check against.
+        keep_common (bool): If True IDs found in target are returned, else
+        IDs not found are returned.
+
+    Yields:
+        (bytes): IDs from source, including any duplicates.
+    """
+    target = iter(target)
+    current = next(target, None)
+    for item in source:
+        while current is not None and current < item:
+            current = next(target, None)
+        if (current == item) == keep_common:
+            yield item
+
+
+def _int_value(value):
+    """Return value as an int, or None if this would change the value.
+
+    Args:
+        value: Value to be converted.
+
+    Returns:
+        (int): value as an int, or None.
+    """
+    if type(value) is int:
+        return value
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if str(number) == value else None
+
+
+def _pack_rows(rows, record_type, int_positions, intern):
+    """Yield each row as a record, with strings interned and ints packed.
+
+    Args:
+        rows (iterable): Rows to be converted.
+        record_type (type): Record type made by make_record_type.
+        int_positions (list): Positions of the columns to store as ints.
+        intern (bool): If True strings are interned.
+
+    Yields:
+        (record): Each row as a record.
+
+    Raises:
+        ValueError: If a value in an int column cannot be stored as an int.
+    """
+    make_record = record_type._make
+    intern_string = sys.intern
+    for n, row in enumerate(rows):
+        if intern:
+            values = [intern_string(value) if type(value) is str else value
+                      for value in row]
+        else:
+            values = list(row)
+        for pos in int_positions:
+            number = _int_value(values[pos])
+            if number is None:
+                raise ValueError('Row {} column {}: {!r} cannot be stored as '
+                                 'an int'.format(n, pos, values[pos]))
+            values[pos] = number
+        yield make_record(values)
+
+
+def _project_rows(rows, columns, keep, header):
+    """Yield each row with only the projected columns.
+
+    Positions are worked out from the first row, so all rows must have the
+    same length. Records are projected to records of a new record type.
+
+    Args:
+        rows (iterable): Rows to be projected.
+        columns (list): Positions or header names of the columns.
+        keep (bool): If True the columns are kept, else they are dropped.
+        header (list): Column names, needed if columns has names.
+
+    Yields:
+        (list or record): New row holding the projected values.
+
+    Raises:
+        ValueError: If a row is not the same length as the first row.
+    """
+    getter = None
+    for n, row in enumerate(rows):
+        if getter is None:
+            num_columns = len(row)
+            getter = _row_projector(row, columns, keep, header)
+        elif len(row) != num_columns:
+            raise ValueError('Row {} has {} columns, expected {}'.format(
+                             n, len(row), num_columns))
+        yield getter(row)
+
+
+def _row_projector(row, columns, keep, header):
+    """Return a function that projects rows shaped like row.
+
+    Args:
+        row (list or record): Example row.
+        columns (list): Positions or header names of the columns.
+        keep (bool): If True the columns are kept, else they are dropped.
+        header (list): Column names, needed if columns has names.
+
+    Returns:
+        (function): Takes a row and returns a new list, or a new record if
+        row is a record.
+    """
+    record_header = _record_header(row)
+    positions = _column_positions(len(row), columns, keep,
+                                  header or record_header)
+    getter = _row_getter(positions)
+    if record_header is None:
+        return getter
+    make_record = make_record_type([record_header[pos] for pos in
+                                    positions])._make
+    return lambda row: make_record(getter(row))
+
+
+def _record_header(row):
+    """Return the column names of a record, or None if row is not a record.
+
+    Args:
+        row: Row to be checked.
+
+    Returns:
+        (list): Header of a record made by make_record_type, or the fields of
+        any other named tuple.
+    """
+    if isinstance(row, tuple) and hasattr(row, '_fields'):
+        return getattr(row, '_header', row._fields)
+    return None
+
+
+def _row_getter(positions):
+    """Return a function that gives the values at positions in a row.
+
+    Args:
+        positions (list): Positions of the values, in output order.
+
+    Returns:
+        (function): Takes a row and returns a new list.
+    """
+    if len(positions) == 1:
+        pos = positions[0]
+        return lambda row: [row[pos]]
+    if positions:
+        get_items = operator.itemgetter(*positions)
+        return lambda row: list(get_items(row))
+    return lambda row: []
+
+
+def _row_key(key_columns):
+    """Return a function that gives the hashable key of a row.
+
+    Args:
+        key_columns (list): Positions of the key columns, or None to use the
+        whole row.
+
+    Returns:
+        (function): Takes a row and returns its key as a tuple.
+    """
+    if key_columns is None:
+        return tuple
+    if isinstance(key_columns, int):
+        key_columns = [key_columns]
+    return lambda row: tuple([row[pos] for pos in key_columns])
+
+
+def _unique_rows(rows, row_key):
+    """Yield the first row for each key.
+
+    Args:
+        rows (iterable): Rows to be checked.
+        row_key (function): Returns the key of a row.
+
+    Yields:
+        (list): Rows with a key not seen before.
+    """
+    seen = set()
+    for row in rows:
+        key = row_key(row)
+        if key not in seen:
+            seen.add(key)
+            yield row
+
+
+def _write_ids(ids, file_name):
+    """Write IDs to a file, one per line.
+
+    Args:
+        ids (iterable): IDs as bytes.
+        file_name (str): Path of the file.
+
+    Returns:
+        num_ids (int): Number of IDs written.
+    """
+    num_ids = 0
+    with open(file_name, 'wb', buffering=CSV_BUFFER_SIZE) as f:
+        for item in ids:
+            f.write(item + b'\n')
+            num_ids += 1
+    return num_ids
+
+
+def _to_column(values):
+    """Return values as a column array.
+
+    Columns of ints or of floats are stored in typed arrays. Any other column
+    is stored in an object array so that values keep their type.
+
+    Args:
+        values (iterable): Values in the column.
+
+    Returns:
+        (ndarray): Column array.
+    """
+    values = list(values)
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif types == {float}:
+        return np.array(values, dtype=float)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+class Table:
+    """Report data stored by column rather than as a list of lists.
+
+    Each column is held in its own array, so a column can be returned as a
+    view without visiting each row. A Table can be passed to extract_list,
+    extract_list_item, find_items, remove_column and convert_to_tuples in
+    place of a list of lists. Indexing or iterating over a Table gives rows as
+    lists.
+
+    Attributes:
+        columns (list): Column arrays, all of the same length.
+        header (list): Column names, or None.
+    """
+
+    def __init__(self, columns, header=None):
+        self.columns = [column if isinstance(column, np.ndarray) else
+                        _to_column(column) for column in columns]
+        self.header = list(header) if header is not None else None
+
+    @classmethod
+    def from_rows(cls, rows, header=None):
+        """Create a Table from a list of lists.
+
+        Args:
+            rows (list): Report data, each row having the same length.
+            header (list): Column names, or None.
+
+        Returns:
+            (Table): Table holding the report data.
+
+        Raises:
+            ValueError: If a row is not the same length as the first row.
+        """
+        rows = list(rows)
+        for n, row in enumerate(rows):
+            if len(row) != len(rows[0]):
+                raise ValueError('Row {} has {} columns, expected {}'.format(
+                                 n, len(row), len(rows[0])))
+        return cls(zip(*rows), header)
+
+    def __getitem__(self, pos):
+        return [column.item(pos) for column in self.columns]
+
+    def __iter__(self):
+        # Rows are made a chunk at a time so the table is not copied at once
+        for start in range(0, len(self), TABLE_CHUNK_SIZE):
+            for row in zip(*(column[start:start + TABLE_CHUNK_SIZE].tolist()
+                             for column in self.columns)):
+                yield list(row)
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def column(self, pos):
+        """Return a view of a column.
+
+        Args:
+            pos (int or str): Position of the column, or its header name.
+
+        Returns:
+            (ndarray): View of the column array.
+        """
+        if isinstance(pos, str):
+            pos = self.header.index(pos)
+        return self.columns[pos].view()
+
+    def select(self, column_positions):
+        """Return a Table with only the given columns.
+
+        Column arrays are shared with this Table rather than copied.
+
+        Args:
+            column_positions (list): Positions of the columns to keep.
+
+        Returns:
+            (Table): Table with the selected columns.
+        """
+        header = None
+        if self.header is not None:
+            header = [self.header[pos] for pos in column_positions]
+        return Table([self.columns[pos] for pos in column_positions], header)
+
+    def take(self, row_positions):
+        """Return a Table with only the given rows.
+
+        Args:
+            row_positions (list): Positions of the rows to keep.
+
+        Returns:
+            (Table): Table with the selected rows.
+        """
+        row_positions = np.asarray(row_positions, dtype=np.intp)
+        return Table([column[row_positions] for column in self.columns],
+                     self.header)
+
+    def to_rows(self):
+        """Return the table as a list of lists.
+
+        Returns:
+            (list): Report data as a list of lists.
+        """
+        return [list(row) for row in zip(*(column.tolist() for column in
+                self.columns))]
+
+
+class ColumnIndex:
+    """Hash index from the values in one or more columns to row positions.
+
+    Built once over a list of lists or a Table so that repeated searches only
+    visit the matching rows rather than the whole table. If key_pos is a list
+    of positions, keys are tuples of the values in those columns, such as
+    (student_id, course). A ColumnIndex can be passed to find_items in place
+    of item_pos.
+
+    Attributes:
+        source_data (list or Table): The indexed report data.
+        key_pos (int or tuple): Position(s) of the key column(s).
+        positions (dict): Row positions for each key, in row order.
+    """
+
+    def __init__(self, source_data, key_pos):
+        self.source_data = source_data
+        if isinstance(key_pos, int):
+            self.key_pos = key_pos
+            key_columns = [key_pos]
+        else:
+            self.key_pos = tuple(key_pos)
+            key_columns = self.key_pos
+        if isinstance(source_data, Table):
+            values = [source_data.columns[pos].tolist() for pos in
+                      key_columns]
+        else:
+            values = [[row[pos] for row in source_data] for pos in
+                      key_columns]
+        keys = values[0] if isinstance(key_pos, int) else zip(*values)
+        self.positions = {}
+        for pos, key in enumerate(keys):
+            self.positions.setdefault(key, []).append(pos)
+
+    def __contains__(self, key):
+        return key in self.positions
+
+    def find(self, keys):
+        """Return the rows that have one of keys.
+
+        Args:
+            keys (list): Keys to look for.
+
+        Returns:
+            (list or Table): Matching rows in their original order. A Table
+            is returned if the index is over a Table.
+        """
+        found = self.find_positions(keys)
+        if isinstance(self.source_data, Table):
+            return self.source_data.take(found)
+        return [self.source_data[pos] for pos in found]
+
+    def find_positions(self, keys):
+        """Return the positions of the rows that have one of keys.
+
+        Args:
+            keys (list): Keys to look for.
+
+        Returns:
+            found (list): Row positions in ascending order.
+        """
+        found = []
+        for key in dict.fromkeys(keys):
+            found.extend(self.positions.get(key, ()))
+        found.sort()
+        return found
+
+
+def extract_list(source_data, item_pos):
+    """Extract a single list from a list of lists.
+    
+    Checks that an int is passed for item_pos then uses this to return the
+    desired list. If item_pos is not an int then False is returned. Must catch
+    False responses when calling function.
+
+    Args:
+        source_data (list or Table): List containing all lists.
+        item_pos (int): Location of the list to be extracted.
+
+    Returns:
+        (list): A single list from the list of lists.
+    """
+    # Check item_pos is an int
+    if check_is_int(item_pos):
+        pos = int(item_pos)
+        # Check item_pos is a valid location
+        if pos < len(source_data):
+            return source_data[pos]
+        else:
+            return False
+    else:
+        return False
+
+
+def extract_lists(source_data):
+    """Extract each item from a nested list into one list.
+    
+    Takes a list which holds one list with a number of items. Extracts
+    each item so that it is one item in one list. Returns a list with
+    multiple items, from a list of one list.
+
+    Args:
+        source_data (list): A list holding one list with multiple items.
+
+    Returns:
+        extracted_list (list): A list with the contents of the inner list
+        extracted.
+
+    File structure (source_data):
+        List within a list [][]
+    """
+    return list(source_data[0])
+
+
+def extract_lists_all(source_data):
+    """Extract each item from a nested list into one list.
+    
+    Takes a list which holds multiple lists with a number of items. Extracts
+    each item so that it is one item in one list. Returns a list with
+    multiple items, from a list of lists. The inner lists can be of different
+    lengths. See flatten_lists for other ways of extracting the items.
+
+    Args:
+        source_data (list): A list holding multiple lists with one or multiple
+        items.
+
+    Returns:
+        extracted_list (list): A list with the contents of the inner lists
+        extracted.
+
+    File structure (source_data):
+        Lists within a list [][]
+    """
+    # Check there are 2 or more items in source_data
+    if len(source_data) == 1:
+        return source_data[0]
+    return flatten_lists(source_data)
+
+
+def extract_list_item(source_data, item_pos):
+    """Extract specific items from a list of lists.
+    
+    Extracts the item in item_pos from each list within a list of lists and
+    returns a list with just the extracted items. If source_data is a Table, a
+    view of the column is returned instead.
+    
+    Args:
+        source_data (list or Table): A list of lists or of records.
+        item_pos (int): Position of the item in each list.
+        
+    Returns:
+        extracted_items (list or ndarray): List of the extracted items.
+    """
+    if isinstance(source_data, Table):
+        return source_data.column(item_pos)
+    extracted_items = []
+    for item in source_data:
+        target_item = item[item_pos]
+        extracted_items.append(target_item)
+    return extracted_items
+
+
+def find_items(source_data, items, item_pos):
+    """Display all records that contain a specific value in a specific column.
+    
+    Takes a list of lists and for each nested list checks for a specific values
+    in the column specified by item_pos. If an identified value is found, the
+    record is added to the returned list. If the same data is searched many
+    times, pass a ColumnIndex built over source_data as item_pos so that only
+    the matching records are visited.
+    
+    Args:
+        source_data (list or Table): List containing nested lists or
+        records.
+        items (list): A list of items to look for.
+        itemp_pos (int or ColumnIndex): Position of the column to search for
+        the items in, or an index over that column.
+    
+    Returns:
+        found_records (list or Table) List of nested lists for the identified
+        records, or a Table if source_data is a Table.
+    """
+    if isinstance(item_pos, ColumnIndex):
+        return item_pos.find(items)
+    if isinstance(source_data, Table):
+        lookup = _make_lookup(items)
+        column = source_data.columns[item_pos]
+        found = [i for i, value in enumerate(column.tolist()) if lookup(value)]
+        return source_data.take(found)
+    lookup = _make_lookup(items)
+    found_records = []
+    for record in source_data:
+        if lookup(record[item_pos]):
+            found_records.append(record)
+    return found_records
+
+
+def find_missing(source, target):
+    """Return items in source list but not in target list.
+    
+    Find items that are in the source list but not in the target list. Source
+    and target should each be a list with a number of items. Items are returned
+    in the order they appear in source, including any duplicates.
+    
+    Args:
+        source (list): Students in the sd_df data.
+        target (list): Students in the lsd_tags_s data. 
+    
+    Returns:
+        missing (list): Students that are missing from target list.
+    """
+    return list_difference(source, target)
+
+
+def find_missing_file(source_file, target_file, output_file,
+                      is_sorted=False, record_width=None):
+    """Write IDs in a source file that are not in a target file.
+    
+    File version of find_missing for files of IDs too large to load into
+    memory. The files are read through memory maps and compared in one pass
+    over each. Files that are not already sorted are sorted first with
+    sort_id_file. IDs are compared as text and written in sorted order,
+    including any duplicates in source_file.
+    
+    Args:
+        source_file (str): Path of the file of IDs to be checked.
+        target_file (str): Path of the file of IDs to check against.
+        output_file (str): Path of the file the missing IDs are written to,
+        one per line.
+        is_sorted (bool): True if both files are already sorted.
+        record_width (int): Bytes per ID for fixed-width files, including any
+        line ending, or None for one ID per line.
+    
+    Returns:
+        num_ids (int): Number of IDs written.
+    """
+    return _compare_id_files(source_file, target_file, output_file,
+                             is_sorted, record_width, False)
+
+
+def flatten_lists(source_data, lazy=False):
+    """Extract each item from a list of lists into one list.
+    
+    The inner lists can be of different lengths. If every inner list is a
+    NumPy array, they are joined with np.concatenate and an array is returned.
+    
+    Args:
+        source_data (list): A list holding lists with any number of items.
+        lazy (bool): If True a generator of the items is returned, so that the
+        items are not all held in memory at once.
+    
+    Returns:
+        (list, ndarray or generator): The items of the inner lists in order.
+    """
+    if lazy:
+        return itertools.chain.from_iterable(source_data)
+    if source_data and all(isinstance(inner, np.ndarray) for inner in
+                           source_data):
+        return np.concatenate(source_data)
+    return list(itertools.chain.from_iterable(source_data))
+
+
+def get_common(list_a, list_b):
+    """Return list with items that appear in both lists.
+    
+    Checks if list_a and list_b are both lists. If one is not a list then
+    returns False. Must catch False returns when calling the function. If both
+    list_a and list_b are in fact lists, will find items that are common to
+    both lists. Items are returned in the order they appear in list_a,
+    including any duplicates.
+    
+    Args:
+        list_a (list): First list of items.
+        list_b (list): Second list of items.
+    
+    Returns:
+        common (list): Items appearing in both lists.
+    
+    List test from https://stackoverflow.com/questions/1835018/how-to-check-if-
+    an-object-is-a-list-or-tuple-but-not-string
+    """
+    if isinstance(list_a,
+                  collections.abc.Sequence) and not isinstance (list_a, str):
+        if isinstance(list_b,
+                  collections.abc.Sequence) and not isinstance (list_b, str):
+            return list_intersection(list_a, list_b)
+        else:
+            return False
+    else:
+        return False
+
+
+def get_common_file(source_file, target_file, output_file, is_sorted=False,
+                    record_width=None):
+    """Write IDs in a source file that are also in a target file.
+    
+    File version of get_common, see find_missing_file.
+    
+    Args:
+        source_file (str): Path of the file of IDs to be checked.
+        target_file (str): Path of the file of IDs to check against.
+        output_file (str): Path of the file the common IDs are written to,
+        one per line.
+        is_sorted (bool): True if both files are already sorted.
+        record_width (int): Bytes per ID for fixed-width files, including any
+        line ending, or None for one ID per line.
+    
+    Returns:
+        num_ids (int): Number of IDs written.
+    """
+    return _compare_id_files(source_file, target_file, output_file,
+                             is_sorted, record_width, True)
+
+
+def iter_convert_to_tuples(rows):
+    """Yield each row as a tuple.
+    
+    Streaming version of convert_to_tuples.
+    
+    Args:
+        rows (iterable): Rows to be converted, such as a csv.reader.
+    
+    Yields:
+        (tuple): Row as a tuple.
+    """
+    return map(tuple, rows)
+
+
+def iter_extract_list_item(rows, item_pos):
+    """Yield the item in item_pos from each row.
+    
+    Streaming version of extract_list_item.
+    
+    Args:
+        rows (iterable): Rows to extract from, such as a csv.reader.
+        item_pos (int): Position of the item in each row.
+    
+    Yields:
+        Item from each row.
+    """
+    return map(operator.itemgetter(item_pos), rows)
+
+
+def iter_find_items(rows, items, item_pos):
+    """Yield rows that contain one of items in the column item_pos.
+    
+    Streaming version of find_items.
+    
+    Args:
+        rows (iterable): Rows to be searched, such as a csv.reader.
+        items (list): A list of items to look for.
+        item_pos (int): Position of the column to search for the items in.
+    
+    Yields:
+        (list): Each row with a value in items.
+    """
+    lookup = _make_lookup(items)
+    return (row for row in rows if lookup(row[item_pos]))
+
+
+def iter_remove_column(rows, column_pos):
+    """Yield each row with a column removed.
+    
+    Streaming version of remove_column. Values are not copied. Rows may
+    have different numbers of fields.
+    
+    Args:
+        rows (iterable): Rows to be processed, such as a csv.reader.
+        column_pos (int): Position of the column to be removed.
+    
+    Yields:
+        (list): New row without the column.
+    """
+    return _drop_column(rows, column_pos)
+
+
+def join_rows(left, right, left_key, right_key=None, how='inner',
+              method='hash', fill='', lazy=False):
+    """Join two sets of report data on one or more key columns.
+    
+    Each left row is joined to every right row with the same key. Joined
+    rows are new lists holding the left row followed by the columns of the
+    right row that are not keys. With method='hash', right is hashed on its
+    keys and left is read once, so it can be a generator of rows, e.g. from
+    read_csv_rows, when lazy=True. With method='merge', both sides must be
+    sorted on their keys and are each read once, so both can be generators.
+    Both methods run in a single pass over each side.
+    
+    Args:
+        left (iterable): Report data, e.g. student details.
+        right (iterable): Report data to join to left, e.g. enrolments.
+        left_key (int or list): Positions of the key columns in left.
+        right_key (int or list): Positions of the key columns in right, or
+        None to use left_key.
+        how (str): Type of join:
+            - 'inner' Only left rows with a match are returned.
+            - 'left' Left rows with no match are returned padded with fill.
+            - 'anti' Only left rows with no match are returned, unchanged.
+        method (str): 'hash' for unsorted data or 'merge' for data sorted on
+        the keys.
+        fill: Value for the right columns of left rows with no match. If
+        right is empty there are no right columns to fill.
+        lazy (bool): If True a generator of joined rows is returned.
+    
+    Returns:
+        joined_data (list or generator): Joined rows.
+    
+    Raises:
+        ValueError: If how or method is not valid, or the keys do not have
+        the same number of columns.
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError('how must be one of {}'.format(JOIN_TYPES))
+    if method not in JOIN_METHODS:
+        raise ValueError('method must be one of {}'.format(JOIN_METHODS))
+    if isinstance(left_key, int):
+        left_key = [left_key]
+    if right_key is None:
+        right_key = left_key
+    elif isinstance(right_key, int):
+        right_key = [right_key]
+    if not left_key or len(left_key) != len(right_key):
+        raise ValueError('left_key and right_key must have the same number '
+                         'of columns')
+    join = _hash_join if method == 'hash' else _merge_join
+    rows = join(left, right, left_key, right_key, how, fill)
+    if lazy:
+        return rows
+    return list(rows)
+
+
+def list_difference(source, *others):
+    """Return items in source that do not appear in any of the other lists.
+    
+    Each of the other lists is hashed once so that the cost is linear in the
+    total size of the lists. Items are returned in the order they appear in
+    source, including any duplicates.
+    
+    Args:
+        source (list): List of items to be checked.
+        others (list): One or more lists to check source against.
+    
+    Returns:
+        missing (list): Items in source not found in any of the other lists.
+    """
+    lookups = [_make_lookup(other) for other in others]
+    if len(lookups) == 1:
+        lookup = lookups[0]
+        return [item for item in source if not lookup(item)]
+    return [item for item in source if not any(lookup(item) for lookup in
+            lookups)]
+
+
+def list_intersection(source, *others):
+    """Return items in source that appear in all of the other lists.
+    
+    Each of the other lists is hashed once so that the cost is linear in the
+    total size of the lists. Items are returned in the order they appear in
+    source, including any duplicates.
+    
+    Args:
+        source (list): List of items to be checked.
+        others (list): One or more lists to check source against.
+    
+    Returns:
+        common (list): Items in source found in every one of the other lists.
+    """
+    lookups = [_make_lookup(other) for other in others]
+    if len(lookups) == 1:
+        lookup = lookups[0]
+        return [item for item in source if lookup(item)]
+    return [item for item in source if all(lookup(item) for lookup in
+            lookups)]
+
+
+def list_symmetric_difference(*lists):
+    """Return items that appear in an odd number of the lists.
+    
+    Matches chaining the symmetric difference (^) of each list as a set, so
+    for two lists it returns items found in one list but not the other. Each
+    item is returned once, in the order it is first seen across the lists.
+    Items must be hashable.
+    
+    Args:
+        lists (list): Lists of items to be compared.
+    
+    Returns:
+        different (list): Unique items found in an odd number of the lists.
+    """
+    counts = {}
+    for this_list in lists:
+        for item in dict.fromkeys(this_list):
+            counts[item] = counts.get(item, 0) + 1
+    return [item for item, count in counts.items() if count % 2 == 1]
+
+
+def list_union(*lists):
+    """Return unique items that appear in any of the lists.
+    
+    Each item is returned once, in the order it is first seen across the
+    lists. Items must be hashable.
+    
+    Args:
+        lists (list): Lists of items to be combined.
+    
+    Returns:
+        combined (list): Unique items found in at least one of the lists.
+    """
+    combined = {}
+    for this_list in lists:
+        combined.update(dict.fromkeys(this_list))
+    return list(combined)
+
+
+def make_record_type(header, name='Record'):
+    """Return a compact record type for rows with the given header.
+    
+    Records are named tuples, so they take less memory than lists and have
+    no per-row dict. A value can be read by position, record[2], or by
+    name, record.first_name. Field names are the column names in lower case
+    with other characters replaced by '_'. Names that still cannot be used
+    are replaced by their position, e.g. _3. The column names are kept in
+    the _header attribute of the type.
+    
+    Args:
+        header (list): Column names.
+        name (str): Name of the record type.
+    
+    Returns:
+        record_type (type): Record type, a subclass of tuple.
+    """
+    fields = [re.sub(r'\W+', '_', str(column).strip()).strip('_').lower() for
+              column in header]
+    record_type = collections.namedtuple(name, fields, rename=True)
+    record_type._header = list(header)
+    return record_type
+
+
+def project_columns(report_data, columns, keep=False, header=None,
+                    lazy=False):
+    """Drop or keep a set of columns from a list of lists.
+    
+    All of the columns are processed in one pass over the rows. New rows are
+    created but the values in them are not copied. Kept columns are returned
+    in the order given in columns. All rows must have the same length.
+    
+    Args:
+        report_data (list or Table): Report data, or any iterable of rows.
+        columns (list): Positions or header names of the columns.
+        keep (bool): If True only the listed columns are kept, else the listed
+        columns are dropped.
+        header (list): Column names for report_data, needed if columns has
+        names. Not needed for a Table with a header or for records.
+        lazy (bool): If True a generator of projected rows is returned.
+    
+    Returns:
+        processed_data (list, generator or Table): Projected report data. If
+        report_data is a Table, a Table sharing the kept columns is returned.
+        Records are returned as records holding the kept columns.
+    
+    Raises:
+        ValueError: If a row is not the same length as the first row.
+    """
+    if isinstance(report_data, Table):
+        positions = _column_positions(len(report_data.columns), columns, keep,
+                                      header or report_data.header)
+        return report_data.select(positions)
+    rows = _project_rows(report_data, columns, keep, header)
+    if lazy:
+        return rows
+    return list(rows)
+
+
+def read_csv_rows(file_name, skip_header=False, compression='infer'):
+    """Yield the rows of a CSV file one at a time.
+    
+    Rows are read as they are needed so that the file can be processed with
+    the iter_ functions without loading it into memory.
+    
+    Args:
+        file_name (str): Path of the CSV file.
+        skip_header (bool): If True the first row is not returned.
+        compression (str): 'gzip', 'bz2', 'xz', None, or 'infer' to use the
+        file extension.
+    
+    Yields:
+        (list): Each row of the file.
+    """
+    with _open_csv(file_name, 'r', compression) as f:
+        reader = csv.reader(f)
+        if skip_header:
+            next(reader, None)
+        yield from reader
+
+
+def remove_column(report_data, column_pos):
+    """Remove a column from a set of data that consists of a list of lists.
+    
+    Removes a column from a list of lists by iterating over each nested list.
+    List must contain lists - will not work on a single lists of characters or
+    other objects. The values in each row are not copied. Rows may have
+    different lengths. To remove several columns at once use
+    project_columns.
+
+    Args:
+        report_data (list or Table): Report data, as lists or records.
+        column_pos (int): Position of the column to be removed.
+
+    Returns:
+        processed_data (list or Table): Report data with the column removed.
+        If report_data is a Table, the remaining columns are not copied.
+    """
+    if isinstance(report_data, Table):
+        return project_columns(report_data, [column_pos])
+    return list(_drop_column(report_data, column_pos))
+
+
+def remove_items(data, items, action='r', in_place=False):
+    """Removes identified items from a list and returns updated list.
+    
+    Only works on lists of items, not on nested lists. If action flag is set to
+    'k' then the items in items are kept and all items not in items are
+    removed. items is hashed once and data is processed in a single pass. The
+    items in data are not copied. Progress is reported as set with
+    set_progress.
+    
+    Args:
+        data (list): List of items to be processed.
+        items (list): List of items to be checked against.
+        action (str): Action to take on items in items:
+            - 'r' Items in items are removed if found.
+            - 'k' Items not in items are removed if found.
+        in_place (bool): If True, data is updated and returned rather than a
+        new list being created.
+    
+    Returns:
+        updated_data (list): Data after processing.
+    """
+    lookup = _make_lookup(items)
+    keep_found = action != 'r'
+    keep_missing = action != 'k'
+    progress = Progress(len(data))
+    updated_data = []
+    for chunk in progress.chunks(data):
+        updated_data.extend([item for item in chunk if (
+                             keep_found if lookup(item) else keep_missing)])
+    progress.finish()
+    if in_place:
+        data[:] = updated_data
+        return data
+    return updated_data
+
+
+def remove_duplicate_rows(report_data, key_columns=None, lazy=False):
+    """Return the rows of a list of lists without duplicates.
+    
+    The first row for each key is kept, in its original order. Only the keys
+    seen so far are held in memory, so a generator of rows can be processed
+    with lazy=True. For files too large for the keys to fit in memory, use
+    remove_duplicates_file.
+    
+    Args:
+        report_data (iterable): Report data, or any iterable of rows.
+        key_columns (int or list): Positions of the columns that identify a
+        row, or None to compare whole rows.
+        lazy (bool): If True a generator of unique rows is returned.
+    
+    Returns:
+        (list or generator): Rows with only one row for each key.
+    """
+    rows = _unique_rows(report_data, _row_key(key_columns))
+    if lazy:
+        return rows
+    return list(rows)
+
+
+def remove_duplicates_file(file_name, output_file, key_columns=None,
+                           header=False, partitions=64, compression='infer'):
+    """Remove duplicate rows from a CSV file that may not fit in memory.
+    
+    Rows are split between temporary files on the hash of their key so that
+    each file can be checked for duplicates on its own, holding only that
+    file's keys in memory. The unique rows from each file are then merged
+    back into their original order. The first row for each key is kept.
+    
+    Args:
+        file_name (str): Path of the CSV file to be read.
+        output_file (str): Path of the CSV file to be written.
+        key_columns (int or list): Positions of the columns that identify a
+        row, or None to compare whole rows.
+        header (bool): If True the first row is a header and is written to
+        output_file without being checked.
+        partitions (int): Number of temporary files. Memory use is roughly the
+        size of the unique keys divided by partitions.
+        compression (str): Compression of file_name and output_file, as for
+        read_csv_rows and write_csv_rows.
+    
+    Returns:
+        num_rows (int): Number of rows written, not including the header.
+    """
+    row_key = _row_key(key_columns)
+    rows = read_csv_rows(file_name, compression=compression)
+    header_row = next(rows, None) if header else None
+    with tempfile.TemporaryDirectory() as folder:
+        names = [os.path.join(folder, '{}.csv'.format(n)) for n in
+                 range(partitions)]
+        files = [open(name, 'w', newline='', encoding='utf-8') for name in
+                 names]
+        try:
+            writers = [csv.writer(f) for f in files]
+            # Each row is saved with its position so order can be restored
+            for pos, row in enumerate(rows):
+                writers[hash(row_key(row)) % partitions].writerow([pos] + row)
+        finally:
+            for f in files:
+                f.close()
+        for name in names:
+            unique = _unique_rows(read_csv_rows(name), lambda row: row_key(
+                                  row[1:]))
+            write_csv_rows(unique, name + '.unique', compression=None)
+            os.remove(name)
+        merged = heapq.merge(*(read_csv_rows(name + '.unique') for name in
+                               names), key=lambda row: int(row[0]))
+        return write_csv_rows((row[1:] for row in merged), output_file,
+                              header_row, compression)
+
+
+def remove_duplicates_list(raw_list):
+    """Return a list with just unique items.
+    
+    The first instance of each item is kept, in its original order. Items
+    that cannot be hashed, such as nested lists, are compared by value and
+    can be mixed with other items.
+    
+    Args:
+        raw_list (list): List with duplicate items.
+        
+    Returns:
+        unique_list (list):: List with only one instance of each item.
+    """
+    try:
+        return list(dict.fromkeys(raw_list))
+    except TypeError: # Unhashable items such as nested lists
+        return list(_unique_rows(raw_list, _item_key))
+
+
+def sort_id_file(file_name, output_file, record_width=None,
+                 chunk_size=None):
+    """Sort a file of IDs that may not fit in memory.
+    
+    IDs are sorted as text in chunks of chunk_size, each saved to a temporary
+    file, and the chunks are then merged. The output has one ID per line.
+    
+    Args:
+        file_name (str): Path of the file of IDs.
+        output_file (str): Path of the sorted file.
+        record_width (int): Bytes per ID for fixed-width files, including any
+        line ending, or None for one ID per line.
+        chunk_size (int): Number of IDs sorted in memory at a time, defaults
+        to SORT_CHUNK_SIZE.
+    
+    Returns:
+        num_ids (int): Number of IDs written.
+    """
+    chunk_size = chunk_size or SORT_CHUNK_SIZE
+    ids = _iter_ids(file_name, record_width)
+    with tempfile.TemporaryDirectory() as folder:
+        runs = []
+        for chunk in iter(lambda: sorted(itertools.islice(ids, chunk_size)),
+                          []):
+            runs.append(os.path.join(folder, '{}.txt'.format(len(runs))))
+            _write_ids(chunk, runs[-1])
+        return _write_ids(heapq.merge(*(_iter_ids(run) for run in runs)),
+                          output_file)
+
+
+def to_records(rows, header=None, int_columns=None, intern=True,
+               lazy=False):
+    """Convert report rows to compact records.
+    
+    Each row becomes a record of a type made by make_record_type. Strings
+    are interned, so a value such as a course name or status that is
+    repeated in many rows is only stored once. A column in int_columns is
+    stored as ints only if every value in it can be stored as an int
+    without changing it, e.g. '12' but not '007' or '', so a column never
+    holds a mix of ints and strings. With lazy=True, rows are converted as
+    they are read, so a value that cannot be stored as an int raises
+    ValueError. Records can be used with extract_list_item, find_items,
+    remove_column and the other row helpers in place of lists.
+    
+    Args:
+        rows (iterable): Report data, or any iterable of rows.
+        header (list): Column names, or None to use the first row.
+        int_columns (list): Positions or header names of columns of whole
+        numbers.
+        intern (bool): If True strings are interned.
+        lazy (bool): If True a generator of records is returned.
+    
+    Returns:
+        records (list or generator): Rows as records.
+    
+    Raises:
+        ValueError: If lazy is True and a value in int_columns cannot be
+        stored as an int.
+    """
+    rows = iter(rows)
+    if header is None:
+        header = next(rows, [])
+    record_type = make_record_type(header)
+    int_positions = _column_positions(len(header), int_columns or [], True,
+                                      header)
+    if lazy:
+        return _pack_rows(rows, record_type, int_positions, intern)
+    records = list(_pack_rows(rows, record_type, [], intern))
+    int_positions = [pos for pos in int_positions if all(_int_value(
+                     record[pos]) is not None for record in records)]
+    if int_positions:
+        make_record = record_type._make
+        for n, record in enumerate(records):
+            values = list(record)
+            for pos in int_positions:
+                values[pos] = _int_value(values[pos])
+            records[n] = make_record(values)
+    return records
+
+
+def write_csv_rows(rows, file_name, header=None, compression='infer',
+                   chunk_size=None):
+    """Write rows to a CSV file.
+    
+    Rows can be a list of lists, a Table or any iterable of rows, such as the
+    output of the iter_ functions. Rows are written in chunks as they are
+    produced, without first converting them to tuples, so that the data is
+    not copied and a streaming pipeline does not need to be held in memory.
+    A Table is written a chunk of columns at a time.
+    
+    Args:
+        rows (iterable or Table): Rows to be written.
+        file_name (str): Path of the CSV file.
+        header (list): Column names to write first, or None. If None and rows
+        is a Table with a header, that header is written.
+        compression (str): 'gzip', 'bz2', 'xz', None, or 'infer' to use the
+        file extension (.gz, .bz2 or .xz).
+        chunk_size (int): Number of rows written at a time, defaults to
+        CSV_CHUNK_SIZE.
+    
+    Returns:
+        num_rows (int): Number of rows written, not including the header.
+    """
+    chunk_size = chunk_size or CSV_CHUNK_SIZE
+    if isinstance(rows, Table):
+        if header is None:
+            header = rows.header
+        columns = rows.columns
+        chunks = (zip(*(column[start:start + chunk_size].tolist() for column
+                  in columns)) for start in range(0, len(rows), chunk_size))
+    else:
+        rows = iter(rows)
+        chunks = iter(lambda: list(itertools.islice(rows, chunk_size)), [])
+    num_rows = 0
+    with _open_csv(file_name, 'w', compression) as f:
+        writer = csv.writer(f)
+        if header is not None:
+            writer.writerow(header)
+        for chunk in chunks:
+            chunk = list(chunk)
+            writer.writerows(chunk)
+            num_rows += len(chunk)
+    return num_rows
@@ -0,0 +1,174 @@
+"""Validation of email addresses and numbers."""
+
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import re
+
+
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9]\S+@\S+[a-zA-Z]\S+[.]\S+[a-zA-Z]')
+EMAIL_PATTERN_2 = re.compile(r'^.*?@.*?\..*?$')
+
+
+def check_email(email):
+    """Check if email address is in a valid format.
+
+    Checks if the email message is greater than 2 characters, contains an '@'
+    symbol with text before it, text after it, a period, and some more text.
+    Note: email addresses with only two characters between @ and . will fail.
+
+    Args:
+        email (str): Email address to be validated.
+
+    Returns:
+        True if email is in a valid format, False otherwise.
+    """
+    return len(email) > 2 and EMAIL_PATTERN.search(email) is not None
+
+
+def check_email_2(email):
+    """Check if email address is in a valid format.
+
+    Checks if the email message is greater than 2 characters, contains an '@'
+    symbol with text before it, text after it, a period, and some more text.
+    Note it is not very accurate - only checks that there is an @ and a . in
+    the email address.
+
+    Args:
+        email (str): Email address to be validated.
+
+    Returns:
+        True if email is in a valid format, False otherwise.
+    """
+    return len(email) > 2 and EMAIL_PATTERN_2.search(email) is not None
+
+
+def _check_email_chunk(emails, strict):
+    """Return a list of bools for a chunk of email addresses.
+
+    Args:
+        emails (list): Email addresses to be validated.
+        strict (bool): If True uses check_email, else uses check_email_2.
+
+    Returns:
+        (list): True for each email address in a valid format.
+    """
+    check = check_email if strict else check_email_2
+    return [check(email) for email in emails]
+
+
+def check_emails(emails, strict=True, workers=1, chunk_size=100000):
+    """Check if each email address in a batch is in a valid format.
+
+    Applies check_email (strict) or check_email_2 (not strict) to each email
+    address. If workers is greater than 1, the addresses are split into chunks
+    of chunk_size that are checked in a process pool.
+
+    Args:
+        emails (iterable): Email addresses to be validated, such as a list or
+        a DataFrame column.
+        strict (bool): If True uses check_email rules, else uses check_email_2
+        rules.
+        workers (int): Number of processes to use.
+        chunk_size (int): Number of email addresses sent to each process at a
+        time.
+
+    Returns:
+        valid (ndarray): Boolean mask, True for each email address in a valid
+        format.
+        invalid (list): Email addresses that are not in a valid format.
+    """
+    import numpy as np # Only loaded when needed
+    emails = list(emails)
+    if workers > 1 and len(emails) > chunk_size:
+        chunks = [emails[i:i + chunk_size] for i in range(0, len(emails),
+                  chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_check_email_chunk, chunks,
+                                   itertools.repeat(strict))
+            valid = list(itertools.chain.from_iterable(results))
+    else:
+        valid = _check_email_chunk(emails, strict)
+    invalid = [email for email, is_valid in zip(emails, valid) if not
+               is_valid]
+    return np.array(valid, dtype=bool), invalid
+
+
+def check_emails_file(file_name, strict=True, workers=1, chunk_size=100000):
+    """Check if each email address in a file is in a valid format.
+
+    The file must have one email address per line. Surrounding whitespace is
+    removed before each address is checked. See check_emails.
+
+    Args:
+        file_name (str): Path of the file to be read.
+        strict (bool): If True uses check_email rules, else uses check_email_2
+        rules.
+        workers (int): Number of processes to use.
+        chunk_size (int): Number of email addresses sent to each process at a
+        time.
+
+    Returns:
+        valid (ndarray): Boolean mask, True for each email address in a valid
+        format.
+        invalid (list): Email addresses that are not in a valid format.
+    """
+    with open(file_name, encoding='utf-8') as f:
+        emails = [line.strip() for line in f]
+    return check_emails(emails, strict, workers, chunk_size)
+
+
+def check_is_float(value):
+    """Check if value can be converted to a float.
+    
+    Tries to convert the value to a float. Used to make sure that a value
+    is a number.
+    
+    Args:
+        value (str): String to check.
+    
+    Returns:
+        True if value is a number (can be converted to a float), False 
+        otherwise.
+    """
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def check_is_int(value):
+    """Check if value can be converted to an integer.
+    
+    Tries to convert the value to an integer. Used to make sure that a value
+    is a number.
+    
+    Args:
+        value (str): String to check.
+    
+    Returns:
+        True if value is a number (can be converted to an int), False 
+        otherwise.
+    """
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+
+def check_lead_zero(to_check):
+    """Check if a number has a leading 0.
+
+    Args:
+        to_check (str): The number to be checked.
+
+    Returns:
+        True if a leading 0 is found or the string is empty, False otherwise.
+    """
+    if str(to_check) in (None, ''):
+        return True
+    elif str(to_check[0]) != '0':
+        return False
+    else:
+        return True
@@ -0,0 +1,611 @@
+"""Benchmarks for the public admintools functions.
+
+Times each public function on synthetic data at a range of sizes and saves
+the results as JSON. Results can be compared against a saved baseline to
+find functions that have become slower.
+
+Usage:
+    python benchmarks.py --sizes 1000 10000 100000 --output results.json
+    python benchmarks.py --compare baseline.json --threshold 1.5
+"""
+
+import argparse
+import contextlib
+import functools
+import inspect
+import io
+import json
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import admintools
+
+
+# Functions that wait for user input and cannot be timed
+INTERACTIVE = ['check_action', 'check_repeat', 'check_repeat_help',
+               'confirm_files']
+# Functions that change module settings rather than process data
+CONTROLS = ['clear_caches', 'disable_batch_mode', 'disable_caching',
+            'disable_profiling', 'enable_batch_mode', 'enable_caching',
+            'enable_profiling', 'get_cache_stats', 'get_profile_stats',
+            'load_batch_config', 'reset_profile_stats', 'set_progress',
+            'write_profile_stats']
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def make_student_ids(size, seed=0):
+    """Return a list of student ID strings.
+
+    About half of the IDs are repeated so that lookups have matches.
+
+    Args:
+        size (int): Number of IDs.
+        seed (int): Random seed.
+
+    Returns:
+        (list): Student IDs.
+    """
+    rng = random.Random(seed)
+    return ['{:07d}'.format(rng.randrange(size * 2)) for _ in range(size)]
+
+
+def make_emails(size, seed=0):
+    """Return a list of email addresses, about one in ten invalid.
+
+    Args:
+        size (int): Number of addresses.
+        seed (int): Random seed.
+
+    Returns:
+        (list): Email addresses.
+    """
+    rng = random.Random(seed)
+    emails = []
+    for _ in range(size):
+        name = ''.join(rng.choices(string.ascii_lowercase, k=8))
+        if rng.random() < 0.1:
+            emails.append(name + '@nodomain')
+        else:
+            emails.append('{}@{}.com'.format(name, rng.choice(['mail',
+                          'example', 'school'])))
+    return emails
+
+
+def make_report(size, num_columns=8, seed=0):
+    """Return report data as a list of lists.
+
+    The first column is a student ID, the second a course code, the third an
+    integer grade and the rest short strings.
+
+    Args:
+        size (int): Number of rows.
+        num_columns (int): Number of columns, at least 3.
+        seed (int): Random seed.
+
+    Returns:
+        (list): Report data.
+    """
+    rng = random.Random(seed)
+    ids = make_student_ids(size, seed)
+    courses = ['C{:03d}'.format(i) for i in range(50)]
+    report = []
+    for i in range(size):
+        row = [ids[i], rng.choice(courses), rng.randrange(100)]
+        row.extend(rng.choice(['A', 'B', 'C', 'yes', 'no', '']) for _ in
+                   range(num_columns - 3))
+        report.append(row)
+    return report
+
+
+def make_counts(size, seed=0):
+    """Return a dictionary of counts keyed by tag.
+
+    Args:
+        size (int): Number of keys.
+        seed (int): Random seed.
+
+    Returns:
+        (dict): Counts for each tag.
+    """
+    rng = random.Random(seed)
+    return {'tag{}'.format(i): rng.randrange(1000) for i in range(size)}
+
+
+def run_cached(func):
+    """Run a callable with admintools caching enabled.
+
+    Args:
+        func (function): Callable to be run.
+    """
+    admintools.enable_caching()
+    try:
+        func()
+    finally:
+        admintools.disable_caching()
+
+
+class Fixtures:
+    """Synthetic data for the benchmark cases, created when first used.
+
+    Each fixture is a cached property, so only the data needed by the cases
+    that are run is created. release frees fixtures that are no longer
+    needed, so that large sizes can be run.
+
+    Attributes:
+        size (int): Size of the synthetic data.
+        folder (str): Folder for files used by the file functions.
+    """
+
+    def __init__(self, size, folder):
+        self.size = size
+        self.folder = folder
+
+    @functools.cached_property
+    def counts(self):
+        return make_counts(self.size)
+
+    @functools.cached_property
+    def csv_file(self):
+        return self._write_file('report.csv', None)
+
+    @functools.cached_property
+    def details(self):
+        return [[row[0], 'First', 'Last'] for row in self.report[::2]]
+
+    @functools.cached_property
+    def email_file(self):
+        return self._write_file('emails.txt', self.emails)
+
+    @functools.cached_property
+    def emails(self):
+        return make_emails(self.size)
+
+    @functools.cached_property
+    def grade_array(self):
+        return np.array(self.grades, dtype=object)
+
+    @functools.cached_property
+    def grades(self):
+        return [str(i % 100) if i % 3 else '' for i in range(self.size)]
+
+    @functools.cached_property
+    def header(self):
+        return ['Column {}'.format(i) for i in range(len(self.report[0]))]
+
+    @functools.cached_property
+    def id_file(self):
+        return self._write_file('ids.txt', self.ids)
+
+    @functools.cached_property
+    def ids(self):
+        return make_student_ids(self.size)
+
+    @functools.cached_property
+    def index(self):
+        return admintools.ColumnIndex(self.report, 0)
+
+    @functools.cached_property
+    def int_array(self):
+        return np.arange(self.size) % 1000
+
+    @functools.cached_property
+    def int_chunks(self):
+        return np.array_split(self.int_array, max(1, self.size // 1000))
+
+    @functools.cached_property
+    def missing_file(self):
+        return os.path.join(self.folder, 'missing.txt')
+
+    @functools.cached_property
+    def nested(self):
+        return [self.ids[i:i + 10] for i in range(0, self.size, 10)]
+
+    @functools.cached_property
+    def ordering_items(self):
+        return ['field{}'.format(i) for i in range(40)]
+
+    @functools.cached_property
+    def other_id_file(self):
+        return self._write_file('other_ids.txt', self.other_ids)
+
+    @functools.cached_property
+    def other_ids(self):
+        return make_student_ids(self.size, seed=1)
+
+    @functools.cached_property
+    def query(self):
+        return self.ids[:max(1, self.size // 100)]
+
+    @functools.cached_property
+    def records(self):
+        return admintools.to_records(self.report, self.header)
+
+    @functools.cached_property
+    def repeated_emails(self):
+        return self.emails[:max(1, self.size // 20)] * 20
+
+    @functools.cached_property
+    def report(self):
+        return make_report(self.size)
+
+    @functools.cached_property
+    def sorted_details(self):
+        return sorted(self.details)
+
+    @functools.cached_property
+    def sorted_report(self):
+        return sorted(self.report, key=lambda row: row[0])
+
+    @functools.cached_property
+    def student_dicts(self):
+        return [dict(zip(self.ordering_items[::-1], range(40))) for _ in
+                range(max(1, self.size // 40))]
+
+    @functools.cached_property
+    def table(self):
+        return admintools.Table.from_rows(self.report)
+
+    def release(self, keep=()):
+        """Free the fixtures that have been created, other than keep.
+
+        Args:
+            keep (iterable): Names of the fixtures to keep.
+        """
+        for name in FIXTURES:
+            if name not in keep:
+                vars(self).pop(name, None)
+
+    def _write_file(self, file_name, lines):
+        """Write a fixture file and return its path.
+
+        Args:
+            file_name (str): Name of the file in folder.
+            lines (list): Lines of the file, or None for the report as CSV.
+
+        Returns:
+            (str): Path of the file.
+        """
+        path = os.path.join(self.folder, file_name)
+        if lines is None:
+            admintools.write_csv_rows(self.report, path)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines))
+        return path
+
+
+FIXTURES = [name for name, value in vars(Fixtures).items() if isinstance(
+            value, functools.cached_property)]
+
+
+def case_fixtures(func):
+    """Return the names of the fixtures used by a benchmark case.
+
+    Args:
+        func (function): Case callable from make_cases.
+
+    Returns:
+        (set): Fixture names.
+    """
+    names = set()
+    codes = [func.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(const for const in code.co_consts if inspect.iscode(
+                     const))
+    return names & set(FIXTURES)
+
+
+def make_cases(data):
+    """Return a callable to time for each public function.
+
+    Fixtures are only created when a case is run.
+
+    Args:
+        data (Fixtures): Synthetic data for the cases.
+
+    Returns:
+        (dict): Function name and a callable that runs it.
+    """
+    size = data.size
+    folder = data.folder
+    return {
+        'ColumnIndex': lambda: admintools.ColumnIndex(data.report, [0, 1]),
+        'Ordering': lambda: admintools.Ordering(data.ordering_items).to_rows(
+            data.student_dicts),
+        'Progress': lambda: sum(len(chunk) for chunk in admintools.Progress(
+            size).chunks(data.ids)),
+        'Table': lambda: admintools.Table.from_rows(data.report),
+        'check_email': lambda: [admintools.check_email(e) for e in
+                                data.emails],
+        'check_email_2': lambda: [admintools.check_email_2(e) for e in
+                                  data.emails],
+        'check_emails': lambda: admintools.check_emails(data.emails),
+        'check_emails_file': lambda: admintools.check_emails_file(
+            data.email_file),
+        'check_is_float': lambda: [admintools.check_is_float(g) for g in
+                                   data.grades],
+        'check_is_int': lambda: [admintools.check_is_int(g) for g in
+                                 data.grades],
+        'check_lead_zero': lambda: [admintools.check_lead_zero(i) for i in
+                                    data.ids],
+        'convert_column_to_nan': lambda: admintools.convert_column_to_nan(
+            data.grade_array, ['', '0']),
+        'convert_column_to_value': lambda: admintools.convert_column_to_value(
+            data.grade_array, ['', '0'], 'none'),
+        'convert_to_float': lambda: [admintools.convert_to_float(g) for g in
+                                     data.grades],
+        'convert_to_floats': lambda: admintools.convert_to_floats(
+            data.grades),
+        'convert_to_int': lambda: [admintools.convert_to_int(g) for g in
+                                   data.grades],
+        'convert_to_ints': lambda: admintools.convert_to_ints(data.grades),
+        'convert_to_nan': lambda: [admintools.convert_to_nan(g, ['', '0']) for
+                                   g in data.grades],
+        'convert_to_tuples': lambda: admintools.convert_to_tuples(
+            data.report),
+        'convert_to_value': lambda: [admintools.convert_to_value(g, ['', '0'],
+                                     'none') for g in data.grades],
+        'copy_dict_reset': lambda: admintools.copy_dict_reset(data.counts),
+        'count_items': lambda: admintools.count_items(data.int_array),
+        'create_dict': lambda: admintools.create_dict(data.ids),
+        'create_ordered_dict': lambda: admintools.create_ordered_dict(
+            data.ids),
+        'create_ordered_list': lambda: admintools.create_ordered_list(
+            data.counts, data.counts),
+        'debug_dict': lambda: admintools.debug_dict(data.counts),
+        'debug_list': lambda: admintools.debug_list(data.ids),
+        'debug_list_item': lambda: [admintools.debug_list_item(i) for i in
+                                    data.ids],
+        'extract_list': lambda: [admintools.extract_list(data.report, i) for
+                                 i in range(len(data.report))],
+        'extract_lists': lambda: admintools.extract_lists([data.ids]),
+        'extract_lists_all': lambda: admintools.extract_lists_all(
+            data.nested),
+        'extract_list_item': lambda: admintools.extract_list_item(
+            data.report, 0),
+        'find_items': lambda: admintools.find_items(data.report, data.query,
+                                                    0),
+        'find_missing': lambda: admintools.find_missing(data.ids,
+                                                        data.other_ids),
+        'find_missing_file': lambda: admintools.find_missing_file(
+            data.id_file, data.other_id_file, data.missing_file),
+        'flatten_lists': lambda: admintools.flatten_lists(data.nested),
+        'flatten_lists[ndarray]': lambda: admintools.flatten_lists(
+            data.int_chunks),
+        'get_common': lambda: admintools.get_common(data.ids, data.other_ids),
+        'get_common_file': lambda: admintools.get_common_file(
+            data.id_file, data.other_id_file, data.missing_file),
+        'iter_convert_to_tuples': lambda: list(
+            admintools.iter_convert_to_tuples(data.report)),
+        'iter_extract_list_item': lambda: list(
+            admintools.iter_extract_list_item(data.report, 0)),
+        'iter_find_items': lambda: list(admintools.iter_find_items(
+            data.report, data.query, 0)),
+        'iter_remove_column': lambda: list(admintools.iter_remove_column(
+            data.report, 1)),
+        'join_rows': lambda: admintools.join_rows(data.report, data.details,
+                                                  0),
+        'list_difference': lambda: admintools.list_difference(
+            data.ids, data.other_ids, data.query),
+        'list_intersection': lambda: admintools.list_intersection(
+            data.ids, data.other_ids, data.query),
+        'list_symmetric_difference': lambda: (
+            admintools.list_symmetric_difference(data.ids, data.other_ids)),
+        'list_union': lambda: admintools.list_union(data.ids, data.other_ids),
+        'make_record_type': lambda: admintools.make_record_type(data.header),
+        'merge_counts': lambda: admintools.merge_counts(data.counts,
+                                                        data.counts),
+        'parallel_apply': lambda: admintools.parallel_apply(
+            admintools.find_items, data.report, data.query, 0, workers=2,
+            chunk_size=max(1, size // 4)),
+        'parallel_filter': lambda: admintools.parallel_filter(
+            admintools.check_email, data.emails, workers=2,
+            chunk_size=max(1, size // 4)),
+        'parallel_map': lambda: admintools.parallel_map(
+            admintools.check_email, data.emails, workers=2,
+            chunk_size=max(1, size // 4)),
+        'project_columns': lambda: admintools.project_columns(data.report,
+                                                              [1, 3, 5]),
+        'read_csv_rows': lambda: sum(1 for row in admintools.read_csv_rows(
+            data.csv_file)),
+        'remove_column': lambda: admintools.remove_column(data.report, 1),
+        'remove_duplicates_list': lambda: admintools.remove_duplicates_list(
+            data.ids),
+        'remove_duplicate_rows': lambda: admintools.remove_duplicate_rows(
+            data.report, [0, 1]),
+        'remove_duplicates_file': lambda: admintools.remove_duplicates_file(
+            data.csv_file, os.path.join(folder, 'unique.csv'), [0, 1]),
+        'remove_items': lambda: admintools.remove_items(data.ids,
+                                                        data.other_ids),
+        'replace_string': lambda: [admintools.replace_string(e, '@', ' at ')
+                                   for e in data.emails],
+        'seed_dict': lambda: admintools.seed_dict(data.other_ids, dict(
+            data.counts), 0),
+        'sort_id_file': lambda: admintools.sort_id_file(
+            data.id_file, os.path.join(folder, 'sorted_ids.txt')),
+        'sort_dict_values': lambda: admintools.sort_dict_values(data.counts),
+        'to_records': lambda: admintools.to_records(data.report, data.header),
+        'update_dict': lambda: admintools.update_dict(dict(data.counts),
+                                                      data.ids),
+        'write_csv_rows': lambda: admintools.write_csv_rows(
+            data.report, os.path.join(folder, 'out.csv')),
+        # Table and index variants of the row helpers
+        'extract_list_item[Table]': lambda: admintools.extract_list_item(
+            data.table, 0),
+        'find_items[ColumnIndex]': lambda: admintools.find_items(
+            data.report, data.query, data.index),
+        'find_items[Table]': lambda: admintools.find_items(data.table,
+                                                           data.query, 0),
+        'extract_list_item[records]': lambda: admintools.extract_list_item(
+            data.records, 0),
+        'find_items[records]': lambda: admintools.find_items(data.records,
+                                                             data.query, 0),
+        'remove_column[records]': lambda: admintools.remove_column(
+            data.records, 1),
+        'join_rows[anti]': lambda: admintools.join_rows(
+            data.report, data.details, 0, how='anti'),
+        'join_rows[left]': lambda: admintools.join_rows(
+            data.report, data.details, 0, how='left'),
+        'join_rows[merge]': lambda: admintools.join_rows(
+            data.sorted_report, data.sorted_details, 0, method='merge'),
+        'write_csv_rows[Table]': lambda: admintools.write_csv_rows(
+            data.table, os.path.join(folder, 'out.csv')),
+        'write_csv_rows[gzip]': lambda: admintools.write_csv_rows(
+            data.report, os.path.join(folder, 'out.csv.gz')),
+        'check_email[cached]': lambda: run_cached(lambda: [
+            admintools.validation.check_email(e) for e in
+            data.repeated_emails]),
+        'convert_to_value[cached]': lambda: run_cached(lambda: [
+            admintools.conversion.convert_to_value(g, ['', '0'], 'none') for
+            g in data.grades]),
+        'sort_dict_values[k=20]': lambda: admintools.sort_dict_values(
+            data.counts, k=20),
+    }
+
+
+def public_functions():
+    """Return the names of the public admintools functions and classes.
+
+    Returns:
+        (list): Function and class names.
+    """
+    return [name for name in admintools.__all__ if inspect.isfunction(
+            getattr(admintools, name)) or inspect.isclass(getattr(admintools,
+            name))]
+
+
+def time_case(func, repeat):
+    """Return the best time for a callable over a number of runs.
+
+    Output printed by the callable is discarded.
+
+    Args:
+        func (function): Callable to be timed.
+        repeat (int): Number of runs.
+
+    Returns:
+        best (float): Fastest run in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(sizes, repeat=3, only=None):
+    """Time each public function at each size.
+
+    The fixtures for a case are created before it is timed. Fixtures that
+    the next case does not use are then freed, so only the data for about
+    one case is held in memory at a time.
+
+    Args:
+        sizes (list): Sizes of the synthetic data.
+        repeat (int): Number of runs for each function and size.
+        only (list): Names of the cases to run, or None for all.
+
+    Returns:
+        (dict): Results, with the time in seconds for each case and size. A
+        case that raised an error has the error message instead.
+    """
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as folder:
+            data = Fixtures(size, folder)
+            cases = [(name, func) for name, func in make_cases(data).items()
+                     if not only or name.split('[')[0] in only]
+            # Cases that use the same fixtures are run together
+            cases.sort(key=lambda case: sorted(case_fixtures(case[1])))
+            for n, (name, func) in enumerate(cases):
+                try:
+                    for fixture in case_fixtures(func): # Not timed
+                        getattr(data, fixture)
+                    result = time_case(func, repeat)
+                except Exception as e:
+                    result = '{}: {}'.format(type(e).__name__, e)
+                results.setdefault(name, {})[str(size)] = result
+                print('{:<32} {:>10} {}'.format(name, size, result))
+                if n + 1 < len(cases):
+                    data.release(case_fixtures(cases[n + 1][1]))
+    missing = [name for name in public_functions() if name not in
+               INTERACTIVE + CONTROLS and name not in results and not only]
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'sizes': sizes,
+        'repeat': repeat,
+        'not_benchmarked': missing,
+        'results': results,
+    }
+
+
+def compare_results(results, baseline, threshold):
+    """Return the cases that are slower than the baseline.
+
+    Args:
+        results (dict): Results from run_benchmarks.
+        baseline (dict): Saved results to compare against.
+        threshold (float): Ratio of new time to baseline time above which a
+        case is a regression.
+
+    Returns:
+        regressions (list): Case name, size, baseline time and new time.
+    """
+    regressions = []
+    for name, timings in results['results'].items():
+        for size, seconds in timings.items():
+            old = baseline.get('results', {}).get(name, {}).get(size)
+            if not isinstance(seconds, float) or not isinstance(old, float):
+                continue
+            if old > 0 and seconds / old > threshold:
+                regressions.append([name, size, old, seconds])
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='data sizes to run, such as 1000 10000000')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per case, the fastest is recorded')
+    parser.add_argument('--only', nargs='+',
+                        help='names of the functions to run')
+    parser.add_argument('--output', help='file to save the results to')
+    parser.add_argument('--compare', help='baseline results file')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='slowdown ratio counted as a regression')
+    args = parser.parse_args(argv)
+    results = run_benchmarks(args.sizes, args.repeat, args.only)
+    if results['not_benchmarked']:
+        print('\nNot benchmarked: {}'.format(', '.join(
+              results['not_benchmarked'])))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        for name, size, old, new in regressions:
+            print('REGRESSION {} at {}: {:.6f}s -> {:.6f}s'.format(name, size,
+                  old, new))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())